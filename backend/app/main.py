@@ -5,6 +5,7 @@ import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.routers import dashboard, datasets, jobs, kpis, projects, reports
@@ -18,6 +19,7 @@ app = FastAPI(
     title="Argus — KPI & Advisory Portal",
     version="0.1.0",
     description="LLM-Driven Business KPI & Advisory Portal MVP",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
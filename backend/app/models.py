@@ -3,10 +3,19 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
+from functools import cached_property
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 # ---------------------------------------------------------------------------
@@ -45,10 +54,10 @@ class ProjectCreate(BaseModel):
 
 
 class Project(BaseModel):
-    project_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    project_id: str = Field(default_factory=_new_id)
     name: str
     business_description: str
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
     status: str = "active"
 
 
@@ -82,14 +91,36 @@ class DatasetProfile(BaseModel):
     potential_join_keys: list[str] = []
     date_columns: list[str] = []
 
+    @cached_property
+    def schema_summary(self) -> str:
+        """Human-readable schema digest, built once per profile instance.
+
+        Several LLM prompt builders embed this for the same profile in one
+        job; caching avoids re-walking every column per prompt.
+        """
+        # One f-string per column, tags short-circuited inline — no extras
+        # list or join allocations on wide schemas. A single truncated sample
+        # keeps prompt tokens down while still identifying the value shape.
+        return "\n".join(
+            [f"Rows: {self.row_count}, Columns: {self.column_count}"]
+            + [
+                f"  {col.name} ({col.dtype})"
+                f"{' [date]' if col.is_date else ''}"
+                f"{' [id]' if col.is_id else ''}"
+                f"{f' [{col.null_pct}% null]' if col.null_pct > 0 else ''}"
+                f" — sample: {repr(col.sample_values[0])[:40] if col.sample_values else ''}"
+                for col in self.columns
+            ]
+        )
+
 
 class Dataset(BaseModel):
-    dataset_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    dataset_id: str = Field(default_factory=_new_id)
     project_id: str
     filename: str
     s3_key: str = ""
     profile: Optional[DatasetProfile] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
 
 
 # ---------------------------------------------------------------------------
@@ -131,7 +162,7 @@ class KPIBreakdownEntry(BaseModel):
 
 
 class KPI(BaseModel):
-    kpi_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kpi_id: str = Field(default_factory=_new_id)
     project_id: str
     name: str
     description: str
@@ -145,7 +176,7 @@ class KPI(BaseModel):
     value_label: Optional[str] = None
     value_breakdown: Optional[list[KPIBreakdownEntry]] = None
     computed_at: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
 
 
 class KPIApprovalRequest(BaseModel):
@@ -161,13 +192,13 @@ class CustomKPIRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 class Job(BaseModel):
-    job_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    job_id: str = Field(default_factory=_new_id)
     project_id: str
     stage: JobStage
     status: JobStatus = JobStatus.queued
     error: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
+    updated_at: str = Field(default_factory=_utcnow_iso)
 
 
 class JobMessage(BaseModel):
@@ -208,14 +239,14 @@ class Recommendation(BaseModel):
 
 
 class AdvisoryReport(BaseModel):
-    report_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    report_id: str = Field(default_factory=_new_id)
     project_id: str
     business_model_summary: str
     risks: list[RiskSignal]
     compliance_notes: list[ComplianceNote]
     forecasts: list[Forecast]
     recommendations: list[Recommendation]
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
     s3_key: str = ""
 
 
@@ -237,7 +268,7 @@ class DashboardWidgetType(str, Enum):
 
 
 class DashboardWidget(BaseModel):
-    widget_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    widget_id: str = Field(default_factory=_new_id)
     type: DashboardWidgetType
     title: str
     description: Optional[str] = None
@@ -248,9 +279,19 @@ class DashboardWidget(BaseModel):
 
 
 class DashboardSpec(BaseModel):
-    dashboard_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    dashboard_id: str = Field(default_factory=_new_id)
     project_id: str
     title: str
     summary: Optional[str] = None
     widgets: list[DashboardWidget]
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_utcnow_iso)
+
+
+# ---------------------------------------------------------------------------
+# Shared TypeAdapters — built once at import so list endpoints reuse the
+# compiled validator instead of looping per item
+# ---------------------------------------------------------------------------
+
+PROJECT_LIST_ADAPTER = TypeAdapter(list[Project])
+KPI_LIST_ADAPTER = TypeAdapter(list[KPI])
+JOB_LIST_ADAPTER = TypeAdapter(list[Job])
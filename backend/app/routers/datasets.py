@@ -1,9 +1,12 @@
 """Datasets router — file upload and profile retrieval."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import uuid
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, Request, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 
 from app.models import Dataset, DatasetProfile
 from app.services import database as db, storage
@@ -12,12 +15,19 @@ router = APIRouter(prefix="/projects/{project_id}/datasets", tags=["datasets"])
 
 
 async def _store_dataset(project_id: str, file: UploadFile) -> Dataset:
-    data = await file.read()
     dataset_id = str(uuid.uuid4())
     filename = file.filename or "upload"
     s3_key = f"uploads/{project_id}/{dataset_id}/{filename}"
 
-    storage.upload_file(s3_key, data, file.content_type or "application/octet-stream")
+    # Stream straight from the spooled upload file — the dataset never sits
+    # fully in memory, and the sync S3 PUT stays off the event loop. The
+    # returned key may carry a .gz suffix when storage compressed the upload.
+    s3_key = await asyncio.to_thread(
+        storage.upload_fileobj,
+        s3_key,
+        file.file,
+        file.content_type or "application/octet-stream",
+    )
 
     dataset = Dataset(
         dataset_id=dataset_id,
@@ -25,7 +35,7 @@ async def _store_dataset(project_id: str, file: UploadFile) -> Dataset:
         filename=filename,
         s3_key=s3_key,
     )
-    db.put_entity("dataset", dataset_id, project_id, dataset.model_dump())
+    db.put_entity("dataset", dataset_id, project_id, dataset.model_dump(exclude_none=True, exclude_defaults=True))
     return dataset
 
 
@@ -59,21 +69,28 @@ async def upload_datasets(
 
 
 @router.get("/{dataset_id}", response_model=Dataset)
-def get_dataset(project_id: str, dataset_id: str) -> Dataset:
-    item = db.get_item("dataset", dataset_id)
+async def get_dataset(project_id: str, dataset_id: str) -> Dataset:
+    item = await run_in_threadpool(db.get_item, "dataset", dataset_id)
     if not item or item.get("project_id") != project_id:
         raise HTTPException(status_code=404, detail="Dataset not found")
-    return Dataset(**item)
+    return Dataset.model_validate(item)
 
 
 @router.get("/{dataset_id}/profile", response_model=DatasetProfile)
-def get_profile(project_id: str, dataset_id: str) -> DatasetProfile:
-    item = db.get_item("dataset", dataset_id)
+async def get_profile(project_id: str, dataset_id: str, request: Request) -> Response:
+    item = await run_in_threadpool(db.get_item, "dataset", dataset_id)
     if not item or item.get("project_id") != project_id:
         raise HTTPException(status_code=404, detail="Dataset not found")
     if not item.get("profile"):
         raise HTTPException(status_code=404, detail="Profile not yet computed")
-    return DatasetProfile(**item["profile"])
+
+    # Frontends poll this endpoint; an ETag over the serialized profile turns
+    # repeat polls into header-only 304s.
+    body = DatasetProfile(**item["profile"]).model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{dataset_id}/download-url")
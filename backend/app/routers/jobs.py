@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from app.models import Job, JobMessage, JobStage, JobStatus
+from app.models import JOB_LIST_ADAPTER, Job, JobMessage, JobStage, JobStatus
 from app.services import database as db, queue as q
 
 router = APIRouter(prefix="/projects/{project_id}/jobs", tags=["jobs"])
@@ -14,7 +16,7 @@ def create_job(project_id: str, stage: JobStage, dataset_id: str | None = None)
     if not db.get_item("project", project_id):
         raise HTTPException(status_code=404, detail="Project not found")
     job = Job(project_id=project_id, stage=stage)
-    db.put_entity("job", job.job_id, project_id, job.model_dump())
+    db.put_entity("job", job.job_id, project_id, job.model_dump(exclude_none=True, exclude_defaults=True))
     msg = JobMessage(
         job_id=job.job_id,
         project_id=project_id,
@@ -26,14 +28,15 @@ def create_job(project_id: str, stage: JobStage, dataset_id: str | None = None)
 
 
 @router.get("/{job_id}", response_model=Job)
-def get_job(project_id: str, job_id: str) -> Job:
-    item = db.get_item("job", job_id)
+async def get_job(project_id: str, job_id: str) -> Job:
+    item = await run_in_threadpool(db.get_item, "job", job_id)
     if not item or item.get("project_id") != project_id:
         raise HTTPException(status_code=404, detail="Job not found")
-    return Job(**item)
+    return Job.model_validate(item)
 
 
-@router.get("/", response_model=list[Job])
-def list_jobs(project_id: str) -> list[Job]:
-    items = db.query_by_project("job", project_id)
-    return [Job(**item) for item in items]
+@router.get("/")
+async def list_jobs(project_id: str) -> ORJSONResponse:
+    items = await run_in_threadpool(db.query_by_project, "job", project_id)
+    jobs = JOB_LIST_ADAPTER.validate_python(items)
+    return ORJSONResponse(JOB_LIST_ADAPTER.dump_python(jobs, mode="json"))
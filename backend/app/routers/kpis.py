@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
-import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
 from app.models import (
     KPI,
+    KPI_LIST_ADAPTER,
     KPIApprovalRequest,
     KPIStatus,
     JobMessage,
@@ -15,62 +17,49 @@ from app.models import (
     CustomKPIRequest,
     DatasetProfile,
 )
-from app.services import database as db, queue as q, storage, llm
-from app.services.kpi_engine import get_group_label
-from app.services.profiler import load_dataframe
+from app.services import database as db, queue as q
 
 router = APIRouter(prefix="/projects/{project_id}/kpis", tags=["kpis"])
 
 
-@router.get("/", response_model=list[KPI])
-def list_kpis(project_id: str) -> list[KPI]:
-    items = db.query_by_project("kpi", project_id)
-    kpis = [KPI(**item) for item in items]
-
-    needs_labels = any(kpi.plan.group_by for kpi in kpis)
-    if not needs_labels:
-        return kpis
-
-    datasets = db.query_by_project("dataset", project_id)
-    if not datasets:
-        return kpis
-
-    frames: list[pd.DataFrame] = []
-    for dataset in datasets:
-        data = storage.download_file(dataset["s3_key"])
-        frames.append(load_dataframe(data, dataset["filename"]))
-    if not frames:
-        return kpis
-
-    df = pd.concat(frames, ignore_index=True, sort=False)
-    updated: list[KPI] = []
-    for kpi in kpis:
-        if kpi.plan.group_by:
-            label = get_group_label(df, kpi.plan)
-            updated.append(kpi.model_copy(update={"value_label": label}))
-        else:
-            updated.append(kpi)
-    return updated
+@router.get("/")
+async def list_kpis(project_id: str) -> ORJSONResponse:
+    # value_label is persisted at compute time by the worker, so listing is a
+    # pure DynamoDB read — no S3 download or DataFrame rebuild per request.
+    # Dump once through the shared adapter and skip FastAPI's second
+    # validation pass over the response model.
+    items = await run_in_threadpool(db.query_by_project, "kpi", project_id)
+    kpis = KPI_LIST_ADAPTER.validate_python(items)
+    return ORJSONResponse(KPI_LIST_ADAPTER.dump_python(kpis, mode="json"))
 
 
 @router.get("/{kpi_id}", response_model=KPI)
-def get_kpi(project_id: str, kpi_id: str) -> KPI:
-    item = db.get_item("kpi", kpi_id)
+async def get_kpi(project_id: str, kpi_id: str) -> KPI:
+    item = await run_in_threadpool(db.get_item, "kpi", kpi_id)
     if not item or item.get("project_id") != project_id:
         raise HTTPException(status_code=404, detail="KPI not found")
-    return KPI(**item)
+    # Validate like the list endpoint: DynamoDB hands numbers back as
+    # Decimal and items written with exclude_defaults are missing keys —
+    # only validation coerces both into the response contract.
+    return KPI.model_validate(item)
 
 
 @router.post("/approve", response_model=list[KPI])
 def approve_kpis(project_id: str, body: KPIApprovalRequest) -> list[KPI]:
     """Human approval gate — sets each KPI to approved or rejected."""
+    items = db.batch_get("kpi", list(body.approvals))
     updated: list[KPI] = []
+    to_write: list[dict] = []
     for kpi_id, status in body.approvals.items():
-        item = db.get_item("kpi", kpi_id)
+        item = items.get(kpi_id)
         if not item or item.get("project_id") != project_id:
             raise HTTPException(status_code=404, detail=f"KPI {kpi_id} not found")
-        db.update_item("kpi", kpi_id, {"status": status.value})
-        updated.append(KPI(**{**item, "status": status}))
+        to_write.append({**item, "status": status.value})
+        # Validate — the raw item carries Decimals and (with
+        # exclude_defaults writes) missing keys that only validation fixes
+        # up for the response.
+        updated.append(KPI.model_validate({**item, "status": status}))
+    db.batch_put(to_write)
 
     # If any KPIs are approved, enqueue computation job
     approved = [k for k in updated if k.status == KPIStatus.approved]
@@ -79,7 +68,7 @@ def approve_kpis(project_id: str, body: KPIApprovalRequest) -> list[KPI]:
             project_id=project_id,
             stage=JobStage.compute_kpis,
         )
-        db.put_entity("job", job.job_id, project_id, job.model_dump())
+        db.put_entity("job", job.job_id, project_id, job.model_dump(exclude_none=True, exclude_defaults=True))
         msg = JobMessage(
             job_id=job.job_id,
             project_id=project_id,
@@ -92,6 +81,8 @@ def approve_kpis(project_id: str, body: KPIApprovalRequest) -> list[KPI]:
 
 @router.post("/custom", response_model=KPI, status_code=201)
 def create_custom_kpi(project_id: str, body: CustomKPIRequest) -> KPI:
+    from app.services import llm  # deferred — pulls in the OpenAI SDK
+
     project = db.get_item("project", project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -124,5 +115,5 @@ def create_custom_kpi(project_id: str, body: CustomKPIRequest) -> KPI:
         unit=proposal.unit,
         status=KPIStatus.proposed,
     )
-    db.put_entity("kpi", kpi.kpi_id, project_id, kpi.model_dump())
+    db.put_entity("kpi", kpi.kpi_id, project_id, kpi.model_dump(exclude_none=True, exclude_defaults=True))
     return kpi
@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.models import AdvisoryReport, RecommendationApprovalRequest
 from app.services import database as db, storage
@@ -12,20 +13,19 @@ router = APIRouter(prefix="/projects/{project_id}/reports", tags=["reports"])
 
 
 @router.get("/latest", response_model=AdvisoryReport)
-def get_latest_report(project_id: str) -> AdvisoryReport:
-    items = db.query_by_project("report", project_id)
-    if not items:
+async def get_latest_report(project_id: str) -> AdvisoryReport:
+    item = await run_in_threadpool(db.query_latest, "report", project_id)
+    if not item:
         raise HTTPException(status_code=404, detail="No report found")
-    items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    return AdvisoryReport(**items[0])
+    return AdvisoryReport.model_validate(item)
 
 
 @router.get("/{report_id}", response_model=AdvisoryReport)
-def get_report(project_id: str, report_id: str) -> AdvisoryReport:
-    item = db.get_item("report", report_id)
+async def get_report(project_id: str, report_id: str) -> AdvisoryReport:
+    item = await run_in_threadpool(db.get_item, "report", report_id)
     if not item or item.get("project_id") != project_id:
         raise HTTPException(status_code=404, detail="Report not found")
-    return AdvisoryReport(**item)
+    return AdvisoryReport.model_validate(item)
 
 
 @router.post("/{report_id}/approve-recommendations", response_model=AdvisoryReport)
@@ -40,11 +40,11 @@ def approve_recommendations(
         raise HTTPException(status_code=404, detail="Report not found")
 
     report = AdvisoryReport(**item)
-    recommendations = list(report.recommendations)
+    # Plain attribute assignment — no validate_assignment configured, so this
+    # avoids a model_copy allocation per touched recommendation.
     for idx, approved in body.approvals.items():
-        if 0 <= idx < len(recommendations):
-            recommendations[idx] = recommendations[idx].model_copy(update={"approved": approved})
+        if 0 <= idx < len(report.recommendations):
+            report.recommendations[idx].approved = approved
 
-    report = report.model_copy(update={"recommendations": recommendations})
-    db.put_entity("report", report_id, project_id, report.model_dump())
+    db.put_entity("report", report_id, project_id, report.model_dump(exclude_none=True, exclude_defaults=True))
     return report
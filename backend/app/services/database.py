@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+import json
 import math
 from typing import Any, Optional
 
@@ -11,14 +14,22 @@ from boto3.dynamodb.conditions import Key
 from app.config import get_settings
 
 
-def _get_table():
+@lru_cache(maxsize=1)
+def _get_session() -> boto3.Session:
     settings = get_settings()
     kwargs: dict[str, Any] = {"region_name": settings.aws_region}
     if settings.aws_access_key_id:
         kwargs["aws_access_key_id"] = settings.aws_access_key_id
         kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-    dynamodb = boto3.resource("dynamodb", **kwargs)
-    return dynamodb.Table(settings.dynamodb_table_name)
+    return boto3.Session(**kwargs)
+
+
+@lru_cache(maxsize=1)
+def _get_table():
+    # Built once per process — settings are lru_cached, so the Table (and its
+    # underlying HTTP connection pool) is safe to reuse across requests.
+    settings = get_settings()
+    return _get_session().resource("dynamodb").Table(settings.dynamodb_table_name)
 
 
 # Entity prefixes for PK/SK
@@ -29,22 +40,62 @@ _PFX = {
     "job": "JOB",
     "report": "REPORT",
     "dashboard": "DASHBOARD",
+    "llm_cache": "LLMCACHE",
 }
 
 
+# Prebound "PREFIX#{}".format closures — key construction is a single dict
+# lookup plus a C-level format call on the hot read/write paths.
+_PK_BUILDERS = {entity: (prefix + "#{}").format for entity, prefix in _PFX.items()}
+
+
 def _pk(entity: str, entity_id: str) -> str:
-    return f"{_PFX[entity]}#{entity_id}"
+    return _PK_BUILDERS[entity](entity_id)
+
+
+def _kpi_status_key(item: dict[str, Any]) -> Optional[str]:
+    """Sparse GSI key for kpi-status-index — present only on KPI items."""
+    if item.get("entity_type") != "kpi" or not item.get("status"):
+        return None
+    status = item["status"]
+    if isinstance(status, Enum):
+        status = status.value
+    return f"{item['project_id']}#{status}"
+
+
+def _json_default(obj: Any) -> str:
+    # Decimals (e.g. items read back from DynamoDB) must not be stringified;
+    # raising here routes the payload to the Python walk, which keeps them.
+    if isinstance(obj, Decimal):
+        raise TypeError("Decimal passthrough")
+    return str(obj)
 
 
 def _to_dynamodb(value: Any) -> Any:
+    """Convert floats to Decimal for DynamoDB.
+
+    Fast path: a single JSON round-trip keeps the traversal in C via
+    parse_float=Decimal. Payloads containing non-finite floats (rejected by
+    allow_nan=False) or existing Decimals fall back to the Python walk.
+    """
+    try:
+        return json.loads(
+            json.dumps(value, default=_json_default, allow_nan=False),
+            parse_float=Decimal,
+        )
+    except (TypeError, ValueError):
+        return _to_dynamodb_py(value)
+
+
+def _to_dynamodb_py(value: Any) -> Any:
     if isinstance(value, float) and not math.isfinite(value):
         return None
     if isinstance(value, float):
         return Decimal(str(value))
     if isinstance(value, list):
-        return [_to_dynamodb(v) for v in value]
+        return [_to_dynamodb_py(v) for v in value]
     if isinstance(value, dict):
-        return {k: _to_dynamodb(v) for k, v in value.items()}
+        return {k: _to_dynamodb_py(v) for k, v in value.items()}
     return value
 
 
@@ -54,28 +105,133 @@ def _to_dynamodb(value: Any) -> Any:
 
 def put_item(entity: str, entity_id: str, data: dict[str, Any]) -> None:
     table = _get_table()
-    item = {"PK": _pk(entity, entity_id), "SK": _pk(entity, entity_id), **_to_dynamodb(data)}
+    key = _pk(entity, entity_id)
+    item = {"PK": key, "SK": key, **_to_dynamodb(data)}
     table.put_item(Item=item)
 
 
 def get_item(entity: str, entity_id: str) -> Optional[dict[str, Any]]:
     table = _get_table()
-    resp = table.get_item(Key={"PK": _pk(entity, entity_id), "SK": _pk(entity, entity_id)})
+    key = _pk(entity, entity_id)
+    resp = table.get_item(Key={"PK": key, "SK": key})
     return resp.get("Item")
 
 
-def update_item(entity: str, entity_id: str, updates: dict[str, Any]) -> None:
+def update_item(
+    entity: str,
+    entity_id: str,
+    updates: dict[str, Any],
+    condition: Optional[str] = None,
+    condition_values: Optional[dict[str, Any]] = None,
+) -> None:
+    """SET the given attributes; optionally guarded by a ConditionExpression.
+
+    condition may reference the #k names of the updated attributes plus any
+    extra :placeholders supplied via condition_values. A failed condition
+    raises ConditionalCheckFailedException — one round trip for a guarded
+    transition instead of a read-then-write pair.
+    """
     table = _get_table()
+    key = _pk(entity, entity_id)
     updates = _to_dynamodb(updates)
     set_exprs = [f"#{k} = :{k}" for k in updates]
     expr_names = {f"#{k}": k for k in updates}
     expr_values = {f":{k}": v for k, v in updates.items()}
-    table.update_item(
-        Key={"PK": _pk(entity, entity_id), "SK": _pk(entity, entity_id)},
-        UpdateExpression="SET " + ", ".join(set_exprs),
-        ExpressionAttributeNames=expr_names,
-        ExpressionAttributeValues=expr_values,
+    kwargs: dict[str, Any] = {
+        "Key": {"PK": key, "SK": key},
+        "UpdateExpression": "SET " + ", ".join(set_exprs),
+        "ExpressionAttributeNames": expr_names,
+        "ExpressionAttributeValues": expr_values,
+    }
+    if condition:
+        kwargs["ConditionExpression"] = condition
+        if condition_values:
+            expr_values.update(_to_dynamodb(condition_values))
+    table.update_item(**kwargs)
+
+
+# BatchGetItem rejects requests with more than 100 keys.
+_BATCH_GET_LIMIT = 100
+
+
+def batch_get(entity: str, entity_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch many items of one entity type via BatchGetItem round trips.
+
+    Keys are paged in chunks of 100 (the BatchGetItem ceiling). Returns a
+    dict keyed by entity id; missing ids are simply absent.
+    """
+    if not entity_ids:
+        return {}
+    table = _get_table()
+    dynamodb = _get_session().resource("dynamodb")
+    build = _PK_BUILDERS[entity]
+    keys = [{"PK": key, "SK": key} for key in map(build, entity_ids)]
+    results: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(keys), _BATCH_GET_LIMIT):
+        request: dict[str, Any] = {
+            table.table_name: {"Keys": keys[start : start + _BATCH_GET_LIMIT]}
+        }
+        while request:
+            resp = dynamodb.batch_get_item(RequestItems=request)
+            for item in resp.get("Responses", {}).get(table.table_name, []):
+                results[item["PK"].split("#", 1)[1]] = item
+            request = resp.get("UnprocessedKeys") or None
+    return results
+
+
+def batch_put(items: list[dict[str, Any]]) -> None:
+    """Write full items through a batch writer — pipelines 25-item BatchWriteItem calls."""
+    if not items:
+        return
+    table = _get_table()
+    with table.batch_writer() as writer:
+        for item in items:
+            item = _to_dynamodb(item)
+            status_key = _kpi_status_key(item)
+            if status_key:
+                item["status_gsi_pk"] = status_key
+            writer.put_item(Item=item)
+
+
+def batch_put_entities(entity: str, project_id: str, rows: list[tuple[str, dict[str, Any]]]) -> None:
+    """put_entity for many items of one type — 25-item BatchWriteItem pages.
+
+    rows is a list of (entity_id, data) pairs; each item gets the same
+    key/GSI attributes put_entity would write.
+    """
+    if not rows:
+        return
+    table = _get_table()
+    build = _PK_BUILDERS[entity]
+    with table.batch_writer() as writer:
+        for entity_id, data in rows:
+            key = build(entity_id)
+            item = {
+                "PK": key,
+                "SK": key,
+                "project_id": project_id,
+                "entity_type": entity,
+                "entity_created": f"{entity}#{data.get('created_at', '')}",
+                **_to_dynamodb(data),
+            }
+            status_key = _kpi_status_key(item)
+            if status_key:
+                item["status_gsi_pk"] = status_key
+            writer.put_item(Item=item)
+
+
+def query_by_entity_type(entity: str) -> list[dict[str, Any]]:
+    """Query all items of one entity type via GSI entity-index.
+
+    Replaces the old full-table scan — cost is O(matching items) instead of
+    O(table size).
+    """
+    table = _get_table()
+    resp = table.query(
+        IndexName="entity-index",
+        KeyConditionExpression=Key("entity_type").eq(entity),
     )
+    return resp.get("Items", [])
 
 
 def query_by_project(entity: str, project_id: str) -> list[dict[str, Any]]:
@@ -88,13 +244,49 @@ def query_by_project(entity: str, project_id: str) -> list[dict[str, Any]]:
     return resp.get("Items", [])
 
 
+def query_kpis_by_status(project_id: str, status: str) -> list[dict[str, Any]]:
+    """Query KPIs of one status via the sparse GSI kpi-status-index.
+
+    Avoids fetching (and discarding) proposed/rejected KPIs client-side.
+    """
+    table = _get_table()
+    resp = table.query(
+        IndexName="kpi-status-index",
+        KeyConditionExpression=Key("status_gsi_pk").eq(f"{project_id}#{status}"),
+    )
+    return resp.get("Items", [])
+
+
+def query_latest(entity: str, project_id: str) -> Optional[dict[str, Any]]:
+    """Return the most recently created item of an entity type for a project.
+
+    Sort-on-write: put_entity maintains an entity_created sort key, so the
+    GSI query transfers one row instead of the project's full history.
+    """
+    table = _get_table()
+    resp = table.query(
+        IndexName="project_id-created-index",
+        KeyConditionExpression=Key("project_id").eq(project_id)
+        & Key("entity_created").begins_with(f"{entity}#"),
+        ScanIndexForward=False,
+        Limit=1,
+    )
+    items = resp.get("Items", [])
+    return items[0] if items else None
+
+
 def put_entity(entity: str, entity_id: str, project_id: str, data: dict[str, Any]) -> None:
     table = _get_table()
+    key = _pk(entity, entity_id)
     item = {
-        "PK": _pk(entity, entity_id),
-        "SK": _pk(entity, entity_id),
+        "PK": key,
+        "SK": key,
         "project_id": project_id,
         "entity_type": entity,
+        "entity_created": f"{entity}#{data.get('created_at', '')}",
         **_to_dynamodb(data),
     }
+    status_key = _kpi_status_key(item)
+    if status_key:
+        item["status_gsi_pk"] = status_key
     table.put_item(Item=item)
@@ -7,8 +7,10 @@ that plan into deterministic Pandas operations — no eval() or exec().
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.models import KPI, KPIBreakdownEntry, KPIFilter, KPIPlan
@@ -22,11 +24,14 @@ _OPERATORS = {
     "lt": lambda s, v: s < v,
     "gte": lambda s, v: s >= v,
     "lte": lambda s, v: s <= v,
-    "in": lambda s, v: s.isin(v if isinstance(v, list) else [v]),
+    "in": lambda s, v: s.isin(set(v) if isinstance(v, list) else {v}),
 }
 
 
 def _apply_filters(df: pd.DataFrame, filters: list[KPIFilter]) -> pd.DataFrame:
+    # Collect one boolean mask per filter and index the frame a single time —
+    # chaining df = df[mask] allocates an intermediate frame per filter.
+    masks: list[np.ndarray] = []
     for f in filters:
         if f.column not in df.columns:
             logger.warning("Filter column %r not found — skipping", f.column)
@@ -35,9 +40,19 @@ def _apply_filters(df: pd.DataFrame, filters: list[KPIFilter]) -> pd.DataFrame:
         if op_fn is None:
             logger.warning("Unknown filter operator %r — skipping", f.operator)
             continue
-        mask = op_fn(df[f.column], f.value)
-        df = df[mask]
-    return df
+        masks.append(np.asarray(op_fn(df[f.column], f.value)))
+    if not masks:
+        return df
+    mask = masks[0] if len(masks) == 1 else np.logical_and.reduce(masks)
+    return df[mask]
+
+
+def _datetime_series(series: pd.Series) -> pd.Series:
+    # Already-parsed datetime64 columns (the common case after
+    # _preparse_datetimes) skip the parse entirely — an O(1) dtype check.
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors="coerce")
 
 
 def _apply_time_window(df: pd.DataFrame, plan: KPIPlan) -> pd.DataFrame:
@@ -47,15 +62,92 @@ def _apply_time_window(df: pd.DataFrame, plan: KPIPlan) -> pd.DataFrame:
         logger.warning("Time column %r not found — skipping window", plan.time_column)
         return df
     try:
-        df = df.copy()
-        df[plan.time_column] = pd.to_datetime(df[plan.time_column], errors="coerce")
-        cutoff = df[plan.time_column].max() - pd.Timedelta(days=plan.time_window_days)
-        df = df[df[plan.time_column] >= cutoff]
+        # Parse into a local Series — no need to copy the frame just to
+        # compare against the cutoff.
+        ts = _datetime_series(df[plan.time_column])
+        cutoff = ts.max() - pd.Timedelta(days=plan.time_window_days)
+        df = df[ts >= cutoff]
     except Exception as exc:
         logger.warning("Could not apply time window: %s", exc)
     return df
 
 
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
+
+
+def _plan_columns(df: pd.DataFrame, plan: KPIPlan) -> list[str]:
+    """Columns the plan actually touches, in frame order."""
+    needed = {plan.column, plan.numerator_column, plan.denominator_column, plan.time_column}
+    needed.update(plan.group_by)
+    needed.update(f.column for f in plan.filters)
+    needed.discard(None)
+    return [c for c in df.columns if c in needed]
+
+
+def _filter_cache_key(plan: KPIPlan) -> tuple:
+    return (
+        plan.time_column,
+        plan.time_window_days,
+        tuple((f.column, f.operator, _hashable(f.value)) for f in plan.filters),
+    )
+
+
+def _filtered_frame(df: pd.DataFrame, plan: KPIPlan, cache: Optional[dict] = None) -> pd.DataFrame:
+    """Apply time window + filters, memoized per compute_kpis invocation.
+
+    KPIs in a batch routinely share the same filter/window spec; the cache
+    (keyed on that spec, scoped to one call) holds one filtered frame per
+    spec — projected to the union of columns the batch's plans need, which
+    compute_kpis records under ("cols", spec) up front — so the frame scan
+    runs once per distinct spec, not once per KPI.
+
+    The time window runs before the filters: its cutoff anchors on the
+    max() of the whole frame's timestamps, and filtering first would shift
+    that anchor to the filtered subset's own latest row ("category=A,
+    last 30 days" would measure 30 days ending at category A's last sale).
+    compute_kpis pre-parses the time columns, so window-first costs no
+    extra datetime parsing. Projecting first means boolean indexing copies
+    3–5 columns instead of the full upload width.
+    """
+    columns = _plan_columns(df, plan)
+    if cache is None:
+        if columns and len(columns) < df.shape[1]:
+            df = df[columns]
+        return _apply_filters(_apply_time_window(df, plan), plan.filters)
+    spec = _filter_cache_key(plan)
+    frame = cache.get(("frame", spec))
+    if frame is None:
+        union = cache.get(("cols", spec)) or set(columns)
+        shared_cols = [c for c in df.columns if c in union]
+        narrowed = df
+        if shared_cols and len(shared_cols) < df.shape[1]:
+            narrowed = df[shared_cols]
+        frame = _apply_filters(_apply_time_window(narrowed, plan), plan.filters)
+        cache[("frame", spec)] = frame
+    if columns and len(columns) < frame.shape[1]:
+        frame = frame[columns]
+    return frame
+
+
+def _missing_filter_column(df: pd.DataFrame, plan: KPIPlan) -> bool:
+    """True when a filter references a column the frame doesn't have.
+
+    Such a predicate can't be honoured — every entry point bails out
+    rather than compute on the unfiltered rows, which would silently
+    report a misleading value.
+    """
+    for f in plan.filters:
+        if f.column not in df.columns:
+            logger.warning("Filter column %r not found — skipping plan", f.column)
+            return True
+    return False
+
+
 def _scalar(val: Any) -> Optional[float]:
     if val is None:
         return None
@@ -69,11 +161,9 @@ def _mean_date_diff_days(df: pd.DataFrame, start_col: str, end_col: str) -> Opti
     if start_col not in df.columns or end_col not in df.columns:
         return None
     try:
-        tmp = df.copy()
-        tmp[start_col] = pd.to_datetime(tmp[start_col], errors="coerce")
-        tmp[end_col] = pd.to_datetime(tmp[end_col], errors="coerce")
-        diffs = (tmp[end_col] - tmp[start_col]).dt.total_seconds() / 86400.0
-        diffs = diffs.dropna()
+        start = _datetime_series(df[start_col])
+        end = _datetime_series(df[end_col])
+        diffs = ((end - start).dt.total_seconds() / 86400.0).dropna()
         if diffs.empty:
             return None
         return _scalar(diffs.mean())
@@ -82,8 +172,16 @@ def _mean_date_diff_days(df: pd.DataFrame, start_col: str, end_col: str) -> Opti
         return None
 
 
+def _numeric_series(series: pd.Series) -> pd.Series:
+    # Trust an already-numeric dtype — to_numeric's coercion loop walks every
+    # element as a Python object even when the column is float64/int64.
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    return pd.to_numeric(series, errors="coerce")
+
+
 def _numeric_or_count_distinct(series: pd.Series) -> Optional[float]:
-    numeric = pd.to_numeric(series, errors="coerce")
+    numeric = _numeric_series(series)
     if numeric.notna().any():
         return _scalar(numeric.sum())
     return _scalar(series.nunique())
@@ -101,33 +199,93 @@ def _grouped_metric_values(df: pd.DataFrame, plan: KPIPlan) -> Optional[pd.Serie
         return None
 
     metric = plan.metric
-    grouped = df.groupby(group_cols, dropna=False)
 
     if metric == "count":
-        return grouped.size().astype(float)
+        return df.groupby(group_cols, dropna=False, sort=False, observed=True).size().astype(float)
 
     if metric == "count_distinct":
         if not plan.column or plan.column not in df.columns:
             return None
-        return grouped[plan.column].nunique().astype(float)
+        return df.groupby(group_cols, dropna=False, sort=False, observed=True)[plan.column].nunique().astype(float)
 
     if metric == "sum":
         if not plan.column or plan.column not in df.columns:
             return None
-        return grouped[plan.column].apply(lambda s: pd.to_numeric(s, errors="coerce").sum())
+        # Coerce once, then let the C-level reducer aggregate — groupby.apply
+        # would re-enter Python per group.
+        numeric = _numeric_series(df[plan.column])
+        return numeric.groupby(
+            [df[c] for c in group_cols], dropna=False, sort=False, observed=True
+        ).sum()
 
     if metric == "mean":
         if plan.column and plan.column in df.columns:
-            return grouped[plan.column].apply(lambda s: pd.to_numeric(s, errors="coerce").mean())
+            numeric = _numeric_series(df[plan.column])
+            return numeric.groupby(
+                [df[c] for c in group_cols], dropna=False, sort=False, observed=True
+            ).mean()
         if plan.numerator_column and plan.denominator_column:
-            return grouped.apply(
+            return df.groupby(group_cols, dropna=False, sort=False, observed=True).apply(
                 lambda g: _mean_date_diff_days(g, plan.denominator_column, plan.numerator_column)
             )
         return None
 
-    if metric in {"ratio", "growth_rate", "mean_days_between"}:
-        plan_no_group = plan.model_copy(update={"group_by": []})
-        return grouped.apply(lambda g: execute_plan(g, plan_no_group))
+    # ratio / growth_rate / mean_days_between used to recurse into
+    # execute_plan per group — a Python frame plus re-filtering for every
+    # group. Each is now a handful of C-level reductions over the whole frame.
+    if metric == "ratio":
+        num_col = plan.numerator_column
+        den_col = plan.denominator_column
+        if not num_col or not den_col:
+            return None
+        if num_col not in df.columns or den_col not in df.columns:
+            return None
+        keys = [df[c] for c in group_cols]
+
+        def _per_group(column: str) -> pd.Series:
+            # Mirrors _numeric_or_count_distinct: numeric sum where the group
+            # has numeric data, distinct count otherwise.
+            numeric = _numeric_series(df[column])
+            totals = numeric.groupby(keys, dropna=False, sort=False, observed=True).sum()
+            has_numeric = numeric.notna().groupby(keys, dropna=False, sort=False, observed=True).any()
+            distinct = (
+                df[column]
+                .groupby(keys, dropna=False, sort=False, observed=True)
+                .nunique()
+                .astype(float)
+            )
+            return totals.where(has_numeric, distinct)
+
+        num = _per_group(num_col)
+        den = _per_group(den_col)
+        return num / den.replace(0, np.nan)
+
+    if metric == "growth_rate":
+        if not plan.column or plan.column not in df.columns:
+            return None
+        if not plan.time_column or plan.time_column not in df.columns:
+            return None
+        ts = _datetime_series(df[plan.time_column])
+        order = ts.to_numpy().argsort(kind="stable")
+        vals = _numeric_series(df[plan.column]).iloc[order]
+        by_time = vals.groupby(
+            [df[c].iloc[order] for c in group_cols], dropna=False, sort=False, observed=True
+        )
+        first = by_time.first()
+        last = by_time.last()
+        return ((last - first) / first.abs()).mask(first == 0)
+
+    if metric == "mean_days_between":
+        if not plan.numerator_column or not plan.denominator_column:
+            return None
+        if plan.numerator_column not in df.columns or plan.denominator_column not in df.columns:
+            return None
+        start = _datetime_series(df[plan.denominator_column])
+        end = _datetime_series(df[plan.numerator_column])
+        diffs = (end - start).dt.total_seconds() / 86400.0
+        return diffs.groupby(
+            [df[c] for c in group_cols], dropna=False, sort=False, observed=True
+        ).mean()
 
     return None
 
@@ -136,7 +294,7 @@ def _grouped_aggregate(df: pd.DataFrame, plan: KPIPlan) -> Optional[float]:
     values = _grouped_metric_values(df, plan)
     if values is None or values.empty:
         return None
-    series = pd.to_numeric(values, errors="coerce").dropna()
+    series = _numeric_series(values).dropna()
     if series.empty:
         return None
     return _scalar(series.max())
@@ -146,15 +304,37 @@ def get_group_label(df: pd.DataFrame, plan: KPIPlan) -> Optional[str]:
     values = _grouped_metric_values(df, plan)
     if values is None or values.empty:
         return None
-    series = pd.to_numeric(values, errors="coerce").dropna()
+    series = _numeric_series(values).dropna()
     if series.empty:
         return None
-    return _group_key_to_label(series.idxmax())
+    # NaNs are already gone, so a plain argmax over the contiguous values
+    # array beats idxmax's Series-level machinery.
+    return _group_key_to_label(series.index[series.to_numpy().argmax()])
+
+
+def _breakdown_entries(series: pd.Series) -> list[KPIBreakdownEntry]:
+    # One numpy pass: sort, broadcast the percent division, then build the
+    # entries — sort_values + per-bucket Python division was three passes.
+    vals = series.to_numpy(dtype=np.float64)
+    total = vals.sum()
+    order = np.argsort(-vals, kind="stable")
+    keys = series.index.to_numpy()[order]
+    vals = vals[order]
+    pcts = vals / total * 100.0 if total else np.full_like(vals, np.nan)
+    return [
+        KPIBreakdownEntry(
+            label=_group_key_to_label(key),
+            value=float(val),
+            pct=None if np.isnan(pct) else float(pct),
+        )
+        for key, val, pct in zip(keys, vals, pcts)
+    ]
 
 
 def build_breakdown(df: pd.DataFrame, plan: KPIPlan) -> Optional[list[KPIBreakdownEntry]]:
-    df = _apply_time_window(df, plan)
-    df = _apply_filters(df, plan.filters)
+    if _missing_filter_column(df, plan):
+        return None
+    df = _filtered_frame(df, plan)
     if df.empty:
         return None
 
@@ -162,30 +342,69 @@ def build_breakdown(df: pd.DataFrame, plan: KPIPlan) -> Optional[list[KPIBreakdo
     if values is None or values.empty:
         return None
 
-    series = pd.to_numeric(values, errors="coerce").dropna()
+    series = _numeric_series(values).dropna()
     if series.empty:
         return None
 
-    total = series.sum()
-    breakdown: list[KPIBreakdownEntry] = []
-    for key, val in series.sort_values(ascending=False).items():
-        pct = None
-        if total and total != 0:
-            pct = float(val / total * 100)
-        breakdown.append(
-            KPIBreakdownEntry(
-                label=_group_key_to_label(key),
-                value=float(val),
-                pct=pct,
-            )
-        )
-    return breakdown
+    return _breakdown_entries(series)
+
 
+def _grouped_results(
+    df: pd.DataFrame, plan: KPIPlan, cache: Optional[dict] = None
+) -> tuple[Optional[float], Optional[str], Optional[list[KPIBreakdownEntry]]]:
+    """Compute value, top-group label, and breakdown from one grouped pass.
 
-def execute_plan(df: pd.DataFrame, plan: KPIPlan) -> Optional[float]:
+    compute_kpis previously derived the three via execute_plan,
+    get_group_label, and build_breakdown — three full scans of the frame per
+    grouped KPI. The grouped Series is materialized once here and shared, and
+    duplicate plans in a batch reuse it via the cache.
+    """
+    if _missing_filter_column(df, plan):
+        return None, None, None
+    frame = _filtered_frame(df, plan, cache)
+    if frame.empty:
+        logger.warning("Plan returned empty dataframe metric=%s", plan.metric)
+        return None, None, None
+
+    values_key = None
+    values = None
+    if cache is not None:
+        values_key = (
+            "grouped",
+            _filter_cache_key(plan),
+            plan.metric,
+            plan.column,
+            tuple(plan.group_by),
+            plan.numerator_column,
+            plan.denominator_column,
+        )
+        values = cache.get(values_key)
+    if values is None:
+        values = _grouped_metric_values(frame, plan)
+        if values_key is not None and values is not None:
+            cache[values_key] = values
+    series = None
+    if values is not None and not values.empty:
+        series = _numeric_series(values).dropna()
+    if series is None or series.empty:
+        # Grouping produced nothing usable — same fallback execute_plan takes.
+        return execute_plan(df, plan, cache), None, None
+
+    label = _group_key_to_label(series.index[series.to_numpy().argmax()])
+    breakdown = _breakdown_entries(series)
+    if plan.metric in {"sum", "count"}:
+        value = _scalar(series.sum())
+    else:
+        value = _scalar(series.max())
+    return value, label, breakdown
+
+
+def execute_plan(df: pd.DataFrame, plan: KPIPlan, cache: Optional[dict] = None) -> Optional[float]:
     """Execute a KPIPlan against a DataFrame and return a scalar result."""
-    df = _apply_time_window(df, plan)
-    df = _apply_filters(df, plan.filters)
+    if _missing_filter_column(df, plan):
+        return None
+
+    df = _filtered_frame(df, plan, cache)
 
     if df.empty:
         logger.warning("Plan returned empty dataframe metric=%s", plan.metric)
@@ -211,11 +430,11 @@ def execute_plan(df: pd.DataFrame, plan: KPIPlan) -> Optional[float]:
         if not plan.column or plan.column not in df.columns:
             logger.warning("sum missing column=%s", plan.column)
             return None
-        return _scalar(pd.to_numeric(df[plan.column], errors="coerce").sum())
+        return _scalar(_numeric_series(df[plan.column]).sum())
 
     if metric == "mean":
         if plan.column and plan.column in df.columns:
-            return _scalar(pd.to_numeric(df[plan.column], errors="coerce").mean())
+            return _scalar(_numeric_series(df[plan.column]).mean())
         if plan.numerator_column and plan.denominator_column:
             return _mean_date_diff_days(df, plan.denominator_column, plan.numerator_column)
         logger.warning("mean missing column or date diff inputs")
@@ -249,12 +468,17 @@ def execute_plan(df: pd.DataFrame, plan: KPIPlan) -> Optional[float]:
         if not plan.time_column or plan.time_column not in df.columns:
             return None
         try:
-            tmp = df.copy()
-            tmp[plan.time_column] = pd.to_datetime(tmp[plan.time_column], errors="coerce")
-            tmp = tmp.sort_values(plan.time_column)
-            tmp["_val"] = pd.to_numeric(tmp[plan.column], errors="coerce")
-            first = tmp["_val"].iloc[0]
-            last = tmp["_val"].iloc[-1]
+            ts = _datetime_series(df[plan.time_column]).to_numpy()
+            vals = _numeric_series(df[plan.column]).to_numpy(dtype=np.float64)
+            # Only the earliest and latest rows matter — argmin/argmax over
+            # the valid timestamps is a linear pass, no O(N log N) sort.
+            valid = ~np.isnat(ts) & ~np.isnan(vals)
+            if not valid.all():
+                ts, vals = ts[valid], vals[valid]
+            if ts.size == 0:
+                return None
+            first = vals[ts.argmin()]
+            last = vals[ts.argmax()]
             if first == 0:
                 return None
             return _scalar((last - first) / abs(first))
@@ -266,6 +490,37 @@ def execute_plan(df: pd.DataFrame, plan: KPIPlan) -> Optional[float]:
     return None
 
 
+def _needs_date_diff(plan: KPIPlan) -> bool:
+    if not plan.numerator_column or not plan.denominator_column:
+        return False
+    return plan.metric == "mean_days_between" or (plan.metric == "mean" and not plan.column)
+
+
+def _preparse_datetimes(df: pd.DataFrame, kpis: list[KPI]) -> pd.DataFrame:
+    """Parse each datetime column referenced by the KPI batch exactly once.
+
+    String-timestamp parsing is O(rows) per call; without this, every KPI
+    sharing a time column re-parses it inside _apply_time_window or
+    _mean_date_diff_days.
+    """
+    columns: set[str] = set()
+    for kpi in kpis:
+        plan = kpi.plan
+        if plan.time_column and plan.time_column in df.columns:
+            columns.add(plan.time_column)
+        if _needs_date_diff(plan):
+            for col in (plan.numerator_column, plan.denominator_column):
+                if col in df.columns:
+                    columns.add(col)
+
+    parsed = {
+        col: pd.to_datetime(df[col], errors="coerce")
+        for col in columns
+        if not pd.api.types.is_datetime64_any_dtype(df[col])
+    }
+    return df.assign(**parsed) if parsed else df
+
+
 def compute_kpis(df: pd.DataFrame, kpis: list[KPI]) -> list[KPI]:
     """Compute values for a list of KPIs against a DataFrame.
 
@@ -273,25 +528,43 @@ def compute_kpis(df: pd.DataFrame, kpis: list[KPI]) -> list[KPI]:
     """
     from datetime import datetime, timezone
 
-    updated = []
+    computed_at = datetime.now(timezone.utc).isoformat()
+    df = _preparse_datetimes(df, kpis)
+    # Scoped to this batch — holds filtered frames and grouped series so
+    # KPIs with identical filter specs (or identical plans) share the work.
+    # The ("cols", spec) prepass lets plans that differ only in metric
+    # columns share one filtered frame projected to their union.
+    cache: dict = {}
     for kpi in kpis:
+        spec = _filter_cache_key(kpi.plan)
+        cache.setdefault(("cols", spec), set()).update(_plan_columns(df, kpi.plan))
+
+    def _compute_one(kpi: KPI) -> KPI:
         breakdown = None
+        label = None
         try:
-            value = execute_plan(df, kpi.plan)
             if kpi.plan.group_by:
-                breakdown = build_breakdown(df, kpi.plan)
-                if breakdown and kpi.plan.metric in {"sum", "count"}:
-                    value = sum(b.value for b in breakdown)
+                value, label, breakdown = _grouped_results(df, kpi.plan, cache)
+            else:
+                value = execute_plan(df, kpi.plan, cache)
         except Exception as exc:
             logger.error("KPI %s computation error: %s", kpi.kpi_id, exc)
             value = None
-        updated.append(
-            kpi.model_copy(
-                update={
-                    "value": value,
-                    "value_breakdown": breakdown,
-                    "computed_at": datetime.now(timezone.utc).isoformat(),
-                }
-            )
+        # The new values are produced right here, so model_construct can skip
+        # re-validating the whole model the way model_copy(update=...) does.
+        fields = dict(kpi.__dict__)
+        fields.update(
+            value=value,
+            value_label=label,
+            value_breakdown=breakdown,
+            computed_at=computed_at,
         )
-    return updated
+        return KPI.model_construct(**fields)
+
+    if len(kpis) <= 1:
+        return [_compute_one(kpi) for kpi in kpis]
+    # KPIs are independent and the heavy lifting is in pandas/numpy C code
+    # that releases the GIL, so a thread pool scales with cores. A cache race
+    # at worst recomputes a frame two threads wanted at the same instant.
+    with ThreadPoolExecutor(max_workers=min(8, len(kpis))) as pool:
+        return list(pool.map(_compute_one, kpis))
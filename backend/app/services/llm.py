@@ -1,16 +1,22 @@
 """LLM service — OpenAI client + prompt helpers."""
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, TYPE_CHECKING
 
-from openai import OpenAI
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from app.config import get_settings
+from app.services import llm_cache
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 from app.models import (
     AdvisoryReport,
-    ColumnProfile,
     DatasetProfile,
     Forecast,
     KPI,
@@ -27,30 +33,79 @@ from app.models import (
 
 logger = logging.getLogger(__name__)
 
-_ALLOWED_OPERATORS = {"eq", "ne", "gt", "lt", "gte", "lte", "in"}
-_ALLOWED_WIDGETS = {w.value for w in DashboardWidgetType}
-_ALLOWED_METRICS = {"sum", "mean", "count", "count_distinct", "ratio", "growth_rate", "mean_days_between"}
+# One Rust-core validation call per filter list instead of a Python-level
+# model construction per item.
+_FILTER_LIST = TypeAdapter(list[KPIFilter])
+# Whole proposal batch in one call — the nested KPIProposal/KPIPlan/KPIFilter
+# construction happens in pydantic-core rather than the interpreter.
+_PROPOSAL_LIST = TypeAdapter(list[KPIProposal])
+
+_ALLOWED_OPERATORS = frozenset({"eq", "ne", "gt", "lt", "gte", "lte", "in"})
+_ALLOWED_WIDGETS = frozenset(w.value for w in DashboardWidgetType)
+_ALLOWED_METRICS = frozenset(
+    {"sum", "mean", "count", "count_distinct", "ratio", "growth_rate", "mean_days_between"}
+)
+
 
+@lru_cache(maxsize=1)
+def _client() -> "OpenAI":
+    # Deferred import — the OpenAI SDK (and its httpx stack) only loads in
+    # processes that actually talk to the LLM, keeping API cold start light.
+    from openai import OpenAI
 
-def _client() -> OpenAI:
     return OpenAI(api_key=get_settings().openai_api_key)
 
 
-def _chat(system: str, user: str, response_format: str = "json_object") -> Any:
+def _chat(system: str, user: str, response_format: str = "json_object", refresh: bool = False) -> Any:
+    # refresh skips the cache read (the new completion still overwrites the
+    # cached one) — retry loops need a genuinely fresh completion, not the
+    # identical cached content back.
     settings = get_settings()
-    response = _client().chat.completions.create(
+    cache_key = llm_cache.response_key(system, user, settings.openai_model)
+    content = None if refresh else llm_cache.get(cache_key)
+    if content is None:
+        response = _client().chat.completions.create(
+            model=settings.openai_model,
+            response_format={"type": response_format},
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=0.2,
+        )
+        content = response.choices[0].message.content
+        llm_cache.put(cache_key, content)
+    if response_format == "json_object":
+        return orjson.loads(content)
+    return content
+
+
+def _parse(system: str, user: str, model_cls: type[BaseModel]) -> BaseModel:
+    """Structured-output completion — the API enforces the model's schema.
+
+    Skips the json.loads + manual dict unpacking of _chat and removes the
+    malformed-JSON retry failure mode. Cached like _chat, with the target
+    model name in the key so schema changes invalidate old hits.
+    """
+    settings = get_settings()
+    cache_key = llm_cache.response_key(
+        f"{system}\0{model_cls.__name__}", user, settings.openai_model
+    )
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        return model_cls.model_validate_json(cached)
+    response = _client().beta.chat.completions.parse(
         model=settings.openai_model,
-        response_format={"type": response_format},
+        response_format=model_cls,
         messages=[
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
         temperature=0.2,
     )
-    content = response.choices[0].message.content
-    if response_format == "json_object":
-        return json.loads(content)
-    return content
+    parsed = response.choices[0].message.parsed
+    llm_cache.put(cache_key, parsed.model_dump_json())
+    return parsed
 
 
 # ---------------------------------------------------------------------------
@@ -58,15 +113,15 @@ def _chat(system: str, user: str, response_format: str = "json_object") -> Any:
 # ---------------------------------------------------------------------------
 
 def interpret_business_model(business_description: str, profile: DatasetProfile) -> str:
-    schema_summary = _schema_summary(profile)
+    schema_summary = profile.schema_summary
     system = (
         "You are an expert business analyst. "
         "Summarize the business model in 2-3 concise sentences based on "
         "the description and dataset schema provided."
     )
     user = (
-        f"Business description: {business_description}\n\n"
-        f"Dataset schema:\n{schema_summary}"
+        f"Dataset schema:\n{schema_summary}\n\n"
+        f"Business description: {business_description}"
     )
     return _chat(system, user, response_format="text")
 
@@ -80,7 +135,7 @@ def generate_kpi_proposals(
     profile: DatasetProfile,
     business_model_summary: str,
 ) -> list[KPIProposal]:
-    schema_summary = _schema_summary(profile)
+    schema_summary = profile.schema_summary
     system = """You are a senior data analyst. Propose 5-8 actionable KPIs for the business.
 Return a JSON object with key "kpis" whose value is a list of KPI objects.
 Each KPI object must have these fields:
@@ -101,57 +156,50 @@ Never use aggregation words (e.g., COUNT, SUM) as filter operators.
 If you include a ratio metric, you MUST supply both numerator_column and denominator_column.
 For mix/segment KPIs (e.g., sales mix by category), include a group_by column so the breakdown can be stored.
 Only reference columns that exist in the schema."""
+    # Static context (schema, description) first, derived summary last —
+    # provider-side prompt caching needs the leading tokens byte-identical
+    # across calls, and retries/regenerations share this whole prefix.
     user = (
+        f"Dataset schema:\n{schema_summary}\n\n"
         f"Business description: {business_description}\n\n"
-        f"Business model summary: {business_model_summary}\n\n"
-        f"Dataset schema:\n{schema_summary}"
+        f"Business model summary: {business_model_summary}"
     )
     attempts = 2
     last_invalid = 0
     for attempt in range(1, attempts + 1):
-        data = _chat(system, user)
+        # Retries must bypass the exact-match cache — re-issuing the
+        # byte-identical prompt would just return the completion attempt 1
+        # rejected, and leave it pinned for future regenerations.
+        data = _chat(system, user, refresh=attempt > 1)
+        try:
+            candidates = _PROPOSAL_LIST.validate_python(data.get("kpis", []))
+        except ValidationError as exc:
+            logger.warning(
+                "Malformed KPI proposals attempt=%s errors=%s", attempt, exc.error_count()
+            )
+            if attempt == attempts:
+                return []
+            continue
         proposals: list[KPIProposal] = []
         invalid_count = 0
-        for item in data.get("kpis", []):
-            plan_data = item.get("plan", {})
-            filters = [
-                KPIFilter(**f) for f in plan_data.get("filters", [])
-            ]
-            invalid_ops = [f.operator for f in filters if f.operator not in _ALLOWED_OPERATORS]
-            metric = plan_data.get("metric", "count")
-            num_col = plan_data.get("numerator_column")
-            den_col = plan_data.get("denominator_column")
-            invalid_ratio = metric == "ratio" and (not num_col or not den_col)
-            if invalid_ops or invalid_ratio:
+        for proposal in candidates:
+            plan = proposal.plan
+            # any() short-circuits at the first bad operator; the detailed
+            # list is only materialized on the cold discard path for the log.
+            has_invalid_ops = any(f.operator not in _ALLOWED_OPERATORS for f in plan.filters)
+            invalid_ratio = plan.metric == "ratio" and (
+                not plan.numerator_column or not plan.denominator_column
+            )
+            if has_invalid_ops or invalid_ratio:
                 invalid_count += 1
                 logger.warning(
                     "Invalid KPI plan discarded name=%s invalid_ops=%s invalid_ratio=%s",
-                    item.get("name"),
-                    invalid_ops,
+                    proposal.name,
+                    [f.operator for f in plan.filters if f.operator not in _ALLOWED_OPERATORS],
                     invalid_ratio,
                 )
                 continue
-            plan = KPIPlan(
-                metric=metric,
-                column=plan_data.get("column"),
-                numerator_column=num_col,
-                denominator_column=den_col,
-                filters=filters,
-                group_by=plan_data.get("group_by", []),
-                time_column=plan_data.get("time_column"),
-                time_window_days=plan_data.get("time_window_days"),
-            )
-            proposals.append(
-                KPIProposal(
-                    name=item["name"],
-                    description=item["description"],
-                    rationale=item["rationale"],
-                    formula=item["formula"],
-                    plan=plan,
-                    target=item.get("target"),
-                    unit=item.get("unit"),
-                )
-            )
+            proposals.append(proposal)
 
         if invalid_count == 0 or attempt == attempts:
             return proposals
@@ -168,7 +216,7 @@ def generate_custom_kpi(
     business_description: str,
     profile: DatasetProfile,
 ) -> tuple[bool, str, KPIProposal | None]:
-    schema_summary = _schema_summary(profile)
+    schema_summary = profile.schema_summary
     system = """You are a senior data analyst. Validate and propose a single KPI based on the user request.
 Return a JSON object with keys:
   viable (bool), reason (string), kpi (object or null)
@@ -181,10 +229,12 @@ If viable is true, kpi must have:
 Filters must use ONLY these operators: [eq, ne, gt, lt, gte, lte, in].
 If metric is ratio, numerator_column and denominator_column are required.
 Only reference columns that exist in the schema."""
+    # The request is the only part that changes between custom-KPI calls on
+    # a project — keep it last so the schema/description prefix cache-hits.
     user = (
+        f"Dataset schema:\n{schema_summary}\n\n"
         f"Business description: {business_description}\n\n"
-        f"User request: {user_request}\n\n"
-        f"Dataset schema:\n{schema_summary}"
+        f"User request: {user_request}"
     )
     data = _chat(system, user)
     viable = bool(data.get("viable", False))
@@ -198,9 +248,9 @@ Only reference columns that exist in the schema."""
     if metric not in _ALLOWED_METRICS:
         return False, "Unsupported metric", None
 
-    filters = [KPIFilter(**f) for f in plan_data.get("filters", [])]
-    invalid_ops = [f.operator for f in filters if f.operator not in _ALLOWED_OPERATORS]
-    if invalid_ops:
+    filters = _FILTER_LIST.validate_python(plan_data.get("filters", []))
+    if any(f.operator not in _ALLOWED_OPERATORS for f in filters):
+        invalid_ops = [f.operator for f in filters if f.operator not in _ALLOWED_OPERATORS]
         return False, f"Invalid operators: {invalid_ops}", None
 
     num_col = plan_data.get("numerator_column")
@@ -234,40 +284,125 @@ Only reference columns that exist in the schema."""
 # Advisory report generation
 # ---------------------------------------------------------------------------
 
+_ADVISORY_PREAMBLE = """You are a management consultant. Analyse the KPI results provided.
+Focus on business shortcomings, market/operational risks, and forward-looking forecasts.
+Do not mention or speculate about KPI calculation quality or data processing deficiencies.
+Avoid diagnosing KPI formulas, data quality, or computation issues."""
+
+class _AdvisorySummaryResponse(BaseModel):
+    business_model_summary: str
+
+
+class _RisksResponse(BaseModel):
+    risks: list[RiskSignal]
+
+
+class _ComplianceResponse(BaseModel):
+    compliance_notes: list[ComplianceNote]
+
+
+class _ForecastsResponse(BaseModel):
+    forecasts: list[Forecast]
+
+
+class _RecommendationDraft(BaseModel):
+    # Recommendation minus the approval state, which is set by reviewers —
+    # structured outputs require every schema field to come from the model.
+    title: str
+    description: str
+    requires_approval: bool
+
+
+class _RecommendationsResponse(BaseModel):
+    recommendations: list[_RecommendationDraft]
+
+
+# Independent report sections, generated as parallel structured-output
+# prompts. Each entry: (section instruction, response schema).
+_ADVISORY_SECTIONS: dict[str, tuple[str, type[BaseModel]]] = {
+    "business_model_summary": (
+        "Provide a 2-3 sentence summary of the business model.",
+        _AdvisorySummaryResponse,
+    ),
+    "risks": (
+        "Identify market and operational risk signals (severity: low|medium|high).",
+        _RisksResponse,
+    ),
+    "compliance_notes": (
+        "Note relevant regulations, observations, and whether action is required.",
+        _ComplianceResponse,
+    ),
+    "forecasts": (
+        "Forecast KPI trends (trend: up|down|flat) with a horizon in days and a narrative.",
+        _ForecastsResponse,
+    ),
+    "recommendations": (
+        "Recommend actions addressing business shortcomings, operational "
+        "improvements, or growth opportunities.",
+        _RecommendationsResponse,
+    ),
+}
+
+
+def _fmt_metric(value: Any) -> str:
+    """Render a KPI value/target with 6 significant digits.
+
+    The advisory prompts (and their cache keys) should not change when a
+    recompute lands on 187.50000000000003 instead of 187.5 — normalizing
+    the volatile numbers keeps near-identical re-runs byte-identical, so
+    the exact-match response cache still hits. Six significant digits is
+    far below anything the narrative sections react to.
+    """
+    if value is None:
+        return "n/a"
+    if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+        return str(value)
+    return format(float(value), ".6g")
+
+
 def generate_advisory_report(
     business_description: str,
     business_model_summary: str,
     kpi_results: list[dict[str, Any]],
     profile: DatasetProfile,
 ) -> tuple[str, list[RiskSignal], list[ComplianceNote], list[Forecast], list[Recommendation]]:
-    system = """You are a management consultant. Analyse the KPI results and produce a structured advisory report.
-Focus on business shortcomings, market/operational risks, and forward-looking forecasts.
-Do not mention or speculate about KPI calculation quality or data processing deficiencies.
-Return a JSON object with these keys:
-  business_model_summary (string),
-  risks: [{title, description, severity (low|medium|high)}],
-  compliance_notes: [{regulation, observation, action_required (bool)}],
-  forecasts: [{kpi_name, horizon_days (int), trend (up|down|flat), narrative}],
-    recommendations: [{title, description, requires_approval (bool)}].
-Recommendations must address business shortcomings, operational improvements, or growth opportunities.
-Avoid diagnosing KPI formulas, data quality, or computation issues."""
     kpi_text = "\n".join(
-        f"- {r['name']}: {r['value']} {r.get('unit', '')} (target: {r.get('target', 'n/a')})"
+        f"- {r['name']}: {_fmt_metric(r['value'])} {r.get('unit', '')}"
+        f" (target: {_fmt_metric(r.get('target'))})"
         for r in kpi_results
     )
-    schema_summary = _schema_summary(profile)
+    # The advisory sections reason over KPI results, not raw data — column
+    # names and date columns are enough context at a fraction of the tokens.
+    columns_line = ", ".join(col.name for col in profile.columns)
+    # Stable context first, volatile KPI results last — keeps the prompt
+    # prefix byte-identical across runs so provider-side prompt caching hits.
     user = (
         f"Business description: {business_description}\n\n"
         f"Business model summary: {business_model_summary}\n\n"
-        f"KPI results:\n{kpi_text}\n\n"
-        f"Dataset schema:\n{schema_summary}"
+        f"Dataset columns: {columns_line}\n"
+        f"Date columns: {', '.join(profile.date_columns)}\n\n"
+        f"KPI results:\n{kpi_text}"
     )
-    data = _chat(system, user)
-    bm_summary = data.get("business_model_summary", business_model_summary)
-    risks = [RiskSignal(**r) for r in data.get("risks", [])]
-    compliance = [ComplianceNote(**c) for c in data.get("compliance_notes", [])]
-    forecasts = [Forecast(**f) for f in data.get("forecasts", [])]
-    recommendations = [Recommendation(**r) for r in data.get("recommendations", [])]
+    # The five sections don't depend on each other — fan the completions out
+    # so report latency is max(section) rather than one monolithic response.
+    with ThreadPoolExecutor(max_workers=len(_ADVISORY_SECTIONS)) as pool:
+        data: dict[str, Any] = dict(
+            zip(
+                _ADVISORY_SECTIONS,
+                pool.map(
+                    lambda spec: _parse(f"{_ADVISORY_PREAMBLE}\n{spec[0]}", user, spec[1]),
+                    _ADVISORY_SECTIONS.values(),
+                ),
+            )
+        )
+    bm_summary = data["business_model_summary"].business_model_summary or business_model_summary
+    risks = data["risks"].risks
+    compliance = data["compliance_notes"].compliance_notes
+    forecasts = data["forecasts"].forecasts
+    recommendations = [
+        Recommendation(**draft.model_dump())
+        for draft in data["recommendations"].recommendations
+    ]
     return bm_summary, risks, compliance, forecasts, recommendations
 
 
@@ -284,7 +419,7 @@ def generate_dashboard_spec(
     kpi_summary = "\n".join(
         f"- {k.kpi_id}: {k.name} = {k.value} {k.unit or ''}" for k in kpis
     )
-    schema_summary = _schema_summary(profile)
+    schema_summary = profile.schema_summary
     system = """You are a data visualization designer.
 Return a JSON object with key "dashboard" containing:
   title (string), summary (string or null), widgets (list)
@@ -297,10 +432,12 @@ Each widget:
     value_key: "value" or "pct" (optional; choose how to plot breakdowns)
   kpi_ids: list of KPI IDs to visualize
 Use only KPI IDs provided. Do not invent IDs."""
+    # Volatile KPI values go last so the schema/description prefix stays
+    # byte-identical across recomputes.
     user = (
+        f"Dataset schema:\n{schema_summary}\n\n"
         f"Business description: {business_description}\n\n"
-        f"KPI list (id: name = value unit):\n{kpi_summary}\n\n"
-        f"Dataset schema:\n{schema_summary}"
+        f"KPI list (id: name = value unit):\n{kpi_summary}"
     )
     data = _chat(system, user)
     dashboard = data.get("dashboard", {})
@@ -345,21 +482,3 @@ Use only KPI IDs provided. Do not invent IDs."""
         widgets=widgets,
     )
 
-
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-def _schema_summary(profile: DatasetProfile) -> str:
-    lines = [f"Rows: {profile.row_count}, Columns: {profile.column_count}"]
-    for col in profile.columns:
-        extras = []
-        if col.is_date:
-            extras.append("date")
-        if col.is_id:
-            extras.append("id")
-        if col.null_pct > 0:
-            extras.append(f"{col.null_pct}% null")
-        tag = f" [{', '.join(extras)}]" if extras else ""
-        lines.append(f"  {col.name} ({col.dtype}){tag} — sample: {col.sample_values[:3]}")
-    return "\n".join(lines)
@@ -0,0 +1,99 @@
+"""OpenAI Batch API — bulk completion path for non-urgent jobs.
+
+Backlog burn-down (many projects queued at once) doesn't need real-time
+completions: the Batch API processes a JSONL of chat requests within 24h at
+half the per-token price and against a separate rate-limit pool. Callers
+pack one request per project via chat_request(), submit the lot, and poll.
+The synchronous path in llm.py remains the default for interactive jobs.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import time
+from typing import Any
+
+import orjson
+
+from app.config import get_settings
+from app.services.llm import _client
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = 30
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def chat_request(custom_id: str, system: str, user: str, response_format: str = "json_object") -> dict[str, Any]:
+    """Build one Batch API line item mirroring llm._chat's request shape."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": get_settings().openai_model,
+            "response_format": {"type": response_format},
+            "messages": [
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            "temperature": 0.2,
+        },
+    }
+
+
+def submit_batch(requests: list[dict[str, Any]]) -> str:
+    """Upload the request JSONL and create a batch; returns the batch id."""
+    if not requests:
+        raise ValueError("No requests to batch")
+    client = _client()
+    payload = b"\n".join(orjson.dumps(r) for r in requests)
+    input_file = client.files.create(
+        file=io.BytesIO(payload),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("Batch submitted batch_id=%s requests=%s", batch.id, len(requests))
+    return batch.id
+
+
+def wait_for_batch(batch_id: str, timeout_seconds: int | None = None) -> dict[str, Any]:
+    """Poll until the batch finishes; returns {custom_id: completion content}.
+
+    Failed line items are logged and omitted so one bad prompt doesn't sink
+    the whole batch.
+    """
+    client = _client()
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _TERMINAL_STATUSES:
+            break
+        if deadline and time.monotonic() > deadline:
+            raise TimeoutError(f"Batch {batch_id} still {batch.status} after timeout")
+        time.sleep(_POLL_SECONDS)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+
+    results: dict[str, Any] = {}
+    output = client.files.content(batch.output_file_id)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            logger.warning(
+                "Batch item failed custom_id=%s status=%s",
+                item.get("custom_id"),
+                response.get("status_code"),
+            )
+            continue
+        body = response.get("body", {})
+        results[item["custom_id"]] = body["choices"][0]["message"]["content"]
+    return results
@@ -0,0 +1,55 @@
+"""LLM response cache — exact-match, DynamoDB-backed.
+
+Worker runs repeatedly issue identical prompts for the same project (the
+report stage re-summarizes the same schema the profile stage already sent).
+Caching the raw completion keyed on a hash of the full prompt turns those
+repeats into a single DynamoDB lookup instead of a multi-second LLM call.
+
+Bump PROMPT_VERSION whenever any system prompt changes — it participates in
+the key, so stale completions for old prompt wording can never be served.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from app.services import database as db
+
+logger = logging.getLogger(__name__)
+
+PROMPT_VERSION = "1"
+_TTL_SECONDS = 7 * 24 * 3600
+
+
+def response_key(system: str, user: str, model: str) -> str:
+    payload = "\0".join((system, user, model, PROMPT_VERSION))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached completion for a prompt key, or None.
+
+    Expiry is checked client-side as well — DynamoDB TTL deletion lags by up
+    to 48 hours.
+    """
+    try:
+        item = db.get_item("llm_cache", key)
+    except Exception as exc:
+        logger.warning("LLM cache read failed: %s", exc)
+        return None
+    if not item or int(item.get("ttl", 0)) < time.time():
+        return None
+    return item.get("content")
+
+
+def put(key: str, content: str) -> None:
+    try:
+        db.put_item(
+            "llm_cache",
+            key,
+            {"content": content, "ttl": int(time.time()) + _TTL_SECONDS},
+        )
+    except Exception as exc:
+        logger.warning("LLM cache write failed: %s", exc)
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import io
 import re
-from typing import Any
+import warnings
+from typing import Any, BinaryIO, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.models import ColumnProfile, DatasetProfile
@@ -14,43 +16,73 @@ _DATE_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 _ID_PATTERNS = re.compile(r"(^id$|_id$|_key$|uuid|guid)", re.IGNORECASE)
+_DATE_LIKE_RE = re.compile(r"^\s*\d{1,4}[-/.]\d{1,2}([-/.]\d{1,4})?")
 _NUMERIC_THRESHOLD = 0.8  # fraction of non-null values that parse as numeric
 
 
-def _infer_is_date(series: pd.Series, name: str) -> bool:
+def _infer_is_date(series: pd.Series, name: str, sample: np.ndarray) -> bool:
     if _DATE_PATTERNS.search(name):
         return True
     if series.dtype == "object":
-        sample = series.dropna().head(20)
+        # Regex pre-filter plus one vectorized parse — the old per-value
+        # to_datetime try/except cost ~20 interpreter round trips per column.
+        values = [str(v) for v in sample[:20]]
+        if not values:
+            return False
+        matching = [v for v in values if _DATE_LIKE_RE.match(v)]
         parsed = 0
-        for val in sample:
-            try:
-                pd.to_datetime(str(val))
-                parsed += 1
-            except Exception:
-                pass
-        return parsed / max(len(sample), 1) >= 0.7
+        if matching:
+            parsed = int(
+                pd.to_datetime(matching, errors="coerce", format="mixed").notna().sum()
+            )
+        return parsed / len(values) >= 0.7
     return pd.api.types.is_datetime64_any_dtype(series)
 
 
 def _infer_is_id(series: pd.Series, name: str) -> bool:
     if _ID_PATTERNS.search(name):
         return True
-    n = len(series.dropna())
-    if n == 0:
+    non_null = series.dropna()
+    n = len(non_null)
+    # Too few values to claim id-ness from uniqueness alone — every tiny
+    # column looks unique.
+    if n < 20:
         return False
-    return series.nunique() / n >= 0.95
-
-
-def _safe_stat(val: Any) -> Any:
-    """Convert numpy scalars to plain Python types."""
-    try:
-        import numpy as np  # noqa: F401
-        if hasattr(val, "item"):
-            return val.item()
-    except ImportError:
-        pass
-    return val
+    # All-unique is the common case for real keys; is_unique answers it
+    # without building the hash table nunique needs.
+    if non_null.is_unique:
+        return True
+    return non_null.nunique() / n >= 0.95
+
+
+def _numeric_stats(numeric: pd.DataFrame, row_count: int) -> dict[Any, tuple[Any, Any, Optional[float]]]:
+    """Min/max/mean for every numeric column in one pass over the 2D block.
+
+    Per-column pandas reductions re-enter the interpreter once per column;
+    reducing the whole float64 block along axis 0 keeps the scan in
+    vectorized C regardless of how wide the frame is.
+    """
+    stats: dict[Any, tuple[Any, Any, Optional[float]]] = {}
+    if numeric.empty or row_count == 0:
+        return stats
+    block = numeric.to_numpy(dtype=np.float64)
+    valid_counts = row_count - np.isnan(block).sum(axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        mins = np.nanmin(block, axis=0)
+        maxs = np.nanmax(block, axis=0)
+        means = np.nanmean(block, axis=0)
+    for i, col in enumerate(numeric.columns):
+        if not valid_counts[i]:
+            stats[col] = (None, None, None)
+            continue
+        exact = numeric.dtypes.iloc[i].kind in "iu"
+        stats[col] = (
+            int(mins[i]) if exact else float(mins[i]),
+            int(maxs[i]) if exact else float(maxs[i]),
+            round(float(means[i]), 4),
+        )
+    return stats
 
 
 def profile_dataframe(df: pd.DataFrame) -> DatasetProfile:
@@ -58,24 +90,45 @@ def profile_dataframe(df: pd.DataFrame) -> DatasetProfile:
     date_columns: list[str] = []
     potential_join_keys: list[str] = []
 
+    row_count = len(df)
+    num_stats = _numeric_stats(df.select_dtypes(include="number"), row_count)
+
     for col in df.columns:
         series = df[col]
-        null_count = int(series.isna().sum())
-        null_pct = round(null_count / len(df) * 100, 2) if len(df) > 0 else 0.0
-        unique_count = int(series.nunique())
-        sample_values = [
-            _safe_stat(v) for v in series.dropna().head(5).tolist()
-        ]
+        # One typed non-null slice per column, shared by the samplers below —
+        # dropna().head() builds a fresh Series (values + copied index) each
+        # call, and on wide frames that allocator churn dominates.
+        arr = series.to_numpy(copy=False)
+        kind = arr.dtype.kind
+        # Narrow numeric lanes get nulls and cardinality from single
+        # vectorized numpy passes; pandas' general-purpose hash table only
+        # earns its keep on object/datetime columns.
+        if kind in "iub":
+            null_count = 0
+            unique_count = int(np.unique(arr).size)
+            non_null = arr[:20]
+        elif kind == "f":
+            nan_mask = np.isnan(arr)
+            null_count = int(nan_mask.sum())
+            valid = arr[~nan_mask] if null_count else arr
+            unique_count = int(np.unique(valid).size)
+            non_null = valid[:20]
+        else:
+            mask = pd.notna(arr)
+            null_count = int(arr.size - mask.sum())
+            unique_count = int(series.nunique(dropna=True))
+            non_null = arr[mask][:20]
+        null_pct = round(null_count / row_count * 100, 2) if row_count > 0 else 0.0
+        # ndarray.tolist() already yields Python scalars for native dtypes.
+        sample_values = non_null[:5].tolist()
 
         dtype_str = str(series.dtype)
-        is_date = _infer_is_date(series, col)
+        is_date = _infer_is_date(series, col, non_null)
         is_id = _infer_is_id(series, col)
 
         col_min = col_max = col_mean = None
-        if pd.api.types.is_numeric_dtype(series):
-            col_min = _safe_stat(series.min())
-            col_max = _safe_stat(series.max())
-            col_mean = round(float(series.mean()), 4) if not series.isna().all() else None
+        if col in num_stats:
+            col_min, col_max, col_mean = num_stats[col]
 
         profile = ColumnProfile(
             name=col,
@@ -98,7 +151,7 @@ def profile_dataframe(df: pd.DataFrame) -> DatasetProfile:
             potential_join_keys.append(col)
 
     return DatasetProfile(
-        row_count=len(df),
+        row_count=row_count,
         column_count=len(df.columns),
         columns=columns,
         date_columns=date_columns,
@@ -108,15 +161,29 @@ def profile_dataframe(df: pd.DataFrame) -> DatasetProfile:
 
 def profile_bytes(data: bytes, filename: str) -> DatasetProfile:
     """Parse CSV or XLSX from bytes and return a DatasetProfile."""
-    if filename.lower().endswith((".xlsx", ".xls")):
-        df = pd.read_excel(io.BytesIO(data))
-    else:
-        df = pd.read_csv(io.BytesIO(data))
-    return profile_dataframe(df)
+    return profile_dataframe(load_dataframe(data, filename))
+
 
+def load_dataframe(data: bytes | BinaryIO, filename: str) -> pd.DataFrame:
+    """Load a CSV or XLSX file from bytes or a stream into a DataFrame.
 
-def load_dataframe(data: bytes, filename: str) -> pd.DataFrame:
-    """Load a CSV or XLSX file from bytes into a DataFrame."""
+    CSVs go through Arrow's multithreaded C++ reader — pandas' default
+    engine parses single-threaded and churns object columns on the way in.
+    Streamed CSV input parses incrementally as bytes arrive, so the raw
+    file never sits fully in memory beside the parsed frame. XLSX stays
+    with pandas/openpyxl, which needs a seekable buffer.
+    """
     if filename.lower().endswith((".xlsx", ".xls")):
+        if not isinstance(data, bytes):
+            data = data.read()
         return pd.read_excel(io.BytesIO(data))
-    return pd.read_csv(io.BytesIO(data))
+    from pyarrow import csv as pa_csv
+
+    if isinstance(data, bytes):
+        table = pa_csv.read_csv(
+            io.BytesIO(data),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+        )
+    else:
+        table = pa_csv.open_csv(data).read_all()
+    return table.to_pandas()
@@ -1,22 +1,28 @@
 """SQS service — job queuing."""
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 
 from app.config import get_settings
 from app.models import JobMessage
 
 
+@lru_cache(maxsize=1)
 def _get_client():
+    # Built once per process — client construction loads service models from
+    # disk, and reusing it keeps the HTTPS connection pool (and TLS session)
+    # alive across calls.
     settings = get_settings()
     kwargs: dict[str, Any] = {"region_name": settings.aws_region}
     if settings.aws_access_key_id:
         kwargs["aws_access_key_id"] = settings.aws_access_key_id
         kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-    return boto3.client("sqs", **kwargs)
+    config = Config(max_pool_connections=50, retries={"mode": "adaptive"}, tcp_keepalive=True)
+    return boto3.client("sqs", config=config, **kwargs)
 
 
 def enqueue_job(message: JobMessage) -> str:
@@ -29,7 +35,7 @@ def enqueue_job(message: JobMessage) -> str:
     return resp["MessageId"]
 
 
-def receive_jobs(max_messages: int = 1, wait_seconds: int = 20) -> list[tuple[str, JobMessage]]:
+def receive_jobs(max_messages: int = 10, wait_seconds: int = 20) -> list[tuple[str, JobMessage]]:
     """Returns list of (receipt_handle, JobMessage) tuples."""
     settings = get_settings()
     client = _get_client()
@@ -40,11 +46,23 @@ def receive_jobs(max_messages: int = 1, wait_seconds: int = 20) -> list[tuple[st
     )
     results = []
     for msg in resp.get("Messages", []):
-        body = json.loads(msg["Body"])
-        results.append((msg["ReceiptHandle"], JobMessage(**body)))
+        # Validate straight from the JSON bytes — pydantic-core parses in
+        # Rust without materializing an intermediate dict.
+        results.append((msg["ReceiptHandle"], JobMessage.model_validate_json(msg["Body"])))
     return results
 
 
+def extend_visibility(receipt_handle: str, timeout_seconds: int) -> None:
+    """Push out a message's visibility timeout while a long stage runs."""
+    settings = get_settings()
+    client = _get_client()
+    client.change_message_visibility(
+        QueueUrl=settings.sqs_queue_url,
+        ReceiptHandle=receipt_handle,
+        VisibilityTimeout=timeout_seconds,
+    )
+
+
 def delete_job(receipt_handle: str) -> None:
     settings = get_settings()
     client = _get_client()
@@ -0,0 +1,32 @@
+"""Small shared helpers for hot paths."""
+from __future__ import annotations
+
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+_NOW_CACHE: Optional[tuple[float, str]] = None
+
+
+def new_ids(n: int) -> list[str]:
+    """Generate n UUID4 strings from a single urandom read.
+
+    Per-instance ``uuid.uuid4()`` acquires the OS RNG once per call; batching
+    the entropy read amortizes that across a whole batch of models.
+    """
+    blob = os.urandom(16 * n)
+    return [
+        str(uuid.UUID(bytes=blob[i * 16:(i + 1) * 16], version=4))
+        for i in range(n)
+    ]
+
+
+def now_iso() -> str:
+    """UTC ISO-8601 timestamp, cached for up to one second."""
+    global _NOW_CACHE
+    tick = time.monotonic()
+    if _NOW_CACHE is None or tick - _NOW_CACHE[0] >= 1.0:
+        _NOW_CACHE = (tick, datetime.now(timezone.utc).isoformat())
+    return _NOW_CACHE[1]
@@ -1,15 +1,23 @@
 """Async worker — polls SQS and processes background jobs."""
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
+import io
 import logging
 import signal
 import sys
 import time
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from typing import Any
 
+import orjson
 import pandas as pd
+from botocore.exceptions import ClientError
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 from app.models import (
     AdvisoryReport,
@@ -18,11 +26,14 @@ from app.models import (
     JobStage,
     JobStatus,
     KPI,
+    KPI_LIST_ADAPTER,
     KPIStatus,
     DashboardSpec,
+    DatasetProfile,
 )
 from app.services import database as db, queue as q, storage
 from app.services import llm, profiler as prof
+from app.utils import new_ids, now_iso
 from app.services.kpi_engine import compute_kpis
 from app.services.profiler import load_dataframe
 
@@ -45,6 +56,42 @@ signal.signal(signal.SIGINT, _signal_handler)
 # Stage handlers
 # ---------------------------------------------------------------------------
 
+class JobContext:
+    """Message-scoped view of the job's DynamoDB rows.
+
+    Each property hits DynamoDB at most once per message; prefetch()
+    resolves several lazy reads concurrently so handlers pay the slowest
+    round trip rather than the sum.
+    """
+
+    def __init__(self, project_id: str) -> None:
+        self.project_id = project_id
+
+    @cached_property
+    def project(self) -> dict[str, Any] | None:
+        return db.get_item("project", self.project_id)
+
+    @cached_property
+    def datasets(self) -> list[dict[str, Any]]:
+        return db.query_by_project("dataset", self.project_id)
+
+    @cached_property
+    def kpis(self) -> list[dict[str, Any]]:
+        return db.query_by_project("kpi", self.project_id)
+
+    @cached_property
+    def approved_kpis(self) -> list[dict[str, Any]]:
+        return db.query_kpis_by_status(self.project_id, KPIStatus.approved.value)
+
+    def prefetch(self, *names: str) -> None:
+        pending = [n for n in names if n not in self.__dict__]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+                list(pool.map(lambda name: getattr(self, name), pending))
+        elif pending:
+            getattr(self, pending[0])
+
+
 def _select_datasets(datasets: list[dict[str, Any]], dataset_id: str | None) -> list[dict[str, Any]]:
     if dataset_id:
         selected = [d for d in datasets if d.get("dataset_id") == dataset_id]
@@ -52,18 +99,149 @@ def _select_datasets(datasets: list[dict[str, Any]], dataset_id: str | None) ->
     return datasets
 
 
-def _load_combined_dataframe(datasets: list[dict[str, Any]]) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    for dataset in datasets:
-        data = storage.download_file(dataset["s3_key"])
-        frames.append(load_dataframe(data, dataset["filename"]))
-    if not frames:
+# Uploaded datasets are immutable (unique S3 keys per upload), so combined
+# frames can be reused across the profile → compute → report stages of one
+# project without revalidation. Small LRU — frames can be large. Keys are
+# (sorted s3 keys, sorted column projection or None).
+_DF_CACHE: OrderedDict[tuple[tuple[str, ...], tuple[str, ...] | None], pd.DataFrame] = OrderedDict()
+_DF_CACHE_MAX = 4
+
+
+def _frame_cache_s3_key(s3_keys: tuple[str, ...]) -> str:
+    digest = hashlib.blake2b("\0".join(s3_keys).encode(), digest_size=16).hexdigest()
+    return f"cache/frames/{digest}.parquet"
+
+
+def _cache_frame(
+    cache_key: tuple[tuple[str, ...], tuple[str, ...] | None], df: pd.DataFrame
+) -> None:
+    _DF_CACHE[cache_key] = df
+    if len(_DF_CACHE) > _DF_CACHE_MAX:
+        _DF_CACHE.popitem(last=False)
+
+
+def _load_combined_dataframe(
+    datasets: list[dict[str, Any]], columns: set[str] | None = None
+) -> pd.DataFrame:
+    """Download, parse, and concatenate the project's uploads.
+
+    columns, when given, prunes the parse to just those columns — bytes
+    moved and memory scale with the projection, not the sheet width.
+    Columns that no upload has come back all-null, matching the engine's
+    null result for plans that reference missing columns.
+    """
+    if not datasets:
         raise ValueError("No datasets found for project")
-    return pd.concat(frames, ignore_index=True, sort=False)
 
-def _handle_profile(job: Job, msg: JobMessage) -> None:
+    s3_keys = tuple(sorted(d["s3_key"] for d in datasets))
+    projection = tuple(sorted(columns)) if columns else None
+    cache_key = (s3_keys, projection)
+    cached = _DF_CACHE.get(cache_key)
+    if cached is not None:
+        _DF_CACHE.move_to_end(cache_key)
+        return cached
+
+    # Second cache layer: the first stage to parse this upload set persists
+    # the combined frame as Parquet, so later stages — often on a different
+    # worker — load columnar binary instead of re-parsing CSV/Excel. Keys
+    # are derived from the immutable upload keys, so no invalidation needed.
+    # Parquet is columnar, so projected reads only decode the needed columns.
+    parquet_key = _frame_cache_s3_key(s3_keys)
+    try:
+        df = pd.read_parquet(
+            io.BytesIO(storage.download_file(parquet_key)),
+            columns=list(projection) if projection else None,
+        )
+        _cache_frame(cache_key, df)
+        return df
+    except Exception:
+        pass  # cold — build from the raw uploads below
+
+    # CSV fast path: stream each GET straight into Arrow's incremental
+    # reader — parsing overlaps the download and the raw bytes never sit
+    # fully in memory beside the parsed table. Arrow concat is zero-copy on
+    # columnar buffers, avoiding pandas' per-column reallocation.
+    if all(d["filename"].lower().endswith(".csv") for d in datasets):
+        convert = (
+            pa_csv.ConvertOptions(include_columns=list(projection), include_missing_columns=True)
+            if projection
+            else None
+        )
+
+        def _read_table(dataset: dict[str, Any]) -> pa.Table:
+            stream = storage.open_stream(dataset["s3_key"])
+            try:
+                return pa_csv.open_csv(stream, convert_options=convert).read_all()
+            finally:
+                stream.close()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(datasets))) as executor:
+            tables = list(executor.map(_read_table, datasets))
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        df = combined.to_pandas()
+    else:
+        # Excel needs a seekable buffer, so download fully; the GETs still
+        # overlap — boto3 releases the GIL during socket I/O. openpyxl has
+        # no cheap projection, so prune after the concat.
+        with ThreadPoolExecutor(max_workers=min(8, len(datasets))) as executor:
+            blobs = list(executor.map(lambda d: storage.download_file(d["s3_key"]), datasets))
+        frames = [
+            load_dataframe(blob, dataset["filename"])
+            for blob, dataset in zip(blobs, datasets)
+        ]
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        if projection:
+            df = df[[c for c in df.columns if c in columns]]
+
+    # Best-effort artifact write — a failure (e.g. unparquetable mixed
+    # object column) just means the next stage re-parses. Only full loads
+    # are persisted so the artifact always has every column.
+    if projection is None:
+        try:
+            buf = io.BytesIO()
+            df.to_parquet(buf, index=False)
+            storage.upload_file(parquet_key, buf.getvalue(), "application/octet-stream")
+        except Exception as exc:
+            logger.debug("Frame cache write skipped key=%s: %s", parquet_key, exc)
+
+    _cache_frame(cache_key, df)
+    return df
+
+def _optimize_dtypes(df: pd.DataFrame, skip: set[str]) -> pd.DataFrame:
+    """Shrink the frame before scan-heavy KPI compute.
+
+    Integer columns downcast to their narrowest fit and low-cardinality
+    object columns become categoricals, so reductions and groupbys move
+    fewer bytes. Floats stay float64 — monetary sums drift at float32
+    precision. skip lists columns the engine parses as datetimes.
+    Operates on a column-shallow copy: the input frame may come from
+    _DF_CACHE and be mid-scan in a concurrent job on _MSG_POOL, so its
+    columns must never be re-typed in place. Untouched columns still
+    share their buffers with the cached frame.
+    """
+    row_count = len(df)
+    if row_count == 0:
+        return df
+    before = int(df.memory_usage(deep=True).sum())
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if col in skip:
+            continue
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            df[col] = pd.to_numeric(series, downcast="integer")
+        elif series.dtype == "object" and series.nunique(dropna=True) / row_count < 0.5:
+            df[col] = series.astype("category")
+    after = int(df.memory_usage(deep=True).sum())
+    logger.info("Frame dtypes optimized bytes_before=%s bytes_after=%s", before, after)
+    return df
+
+
+def _handle_profile(job: Job, msg: JobMessage, ctx: JobContext) -> None:
     """Profile dataset and then immediately generate KPI proposals."""
-    datasets = db.query_by_project("dataset", msg.project_id)
+    ctx.prefetch("datasets", "project")
+    datasets = ctx.datasets
+    project = ctx.project
     if not datasets:
         raise ValueError("No datasets found for project")
     selected = _select_datasets(datasets, msg.dataset_id)
@@ -84,17 +262,32 @@ def _handle_profile(job: Job, msg: JobMessage) -> None:
         profile.column_count,
     )
 
-    for dataset in selected:
-        db.update_item("dataset", dataset["dataset_id"], {"profile": profile.model_dump()})
-
-    project = db.get_item("project", msg.project_id)
     business_description = project.get("business_description", "") if project else ""
 
-    bm_summary = llm.interpret_business_model(business_description, profile)
+    # The per-dataset profile writes and the first LLM call are independent
+    # — run the writes in the background behind the 1-3s completion.
+    profile_dump = profile.model_dump()
+
+    def _persist_profiles() -> None:
+        for dataset in selected:
+            db.update_item("dataset", dataset["dataset_id"], {"profile": profile_dump})
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        writes = pool.submit(_persist_profiles)
+        bm_summary = llm.interpret_business_model(business_description, profile)
+        writes.result()
+
+    # Persist — the report stage reuses this instead of re-deriving it.
+    db.update_item("project", msg.project_id, {"business_model_summary": bm_summary})
     proposals = llm.generate_kpi_proposals(business_description, profile, bm_summary)
 
-    for proposal in proposals:
-        kpi = KPI(
+    # Batch-generate ids and share one timestamp so pydantic skips the
+    # per-instance default factories across the whole proposal set.
+    kpi_ids = new_ids(len(proposals))
+    created_at = now_iso()
+    kpis = [
+        KPI(
+            kpi_id=kpi_id,
             project_id=msg.project_id,
             name=proposal.name,
             description=proposal.description,
@@ -104,33 +297,63 @@ def _handle_profile(job: Job, msg: JobMessage) -> None:
             target=proposal.target,
             unit=proposal.unit,
             status=KPIStatus.proposed,
+            created_at=created_at,
         )
-        db.put_entity("kpi", kpi.kpi_id, msg.project_id, kpi.model_dump())
+        for proposal, kpi_id in zip(proposals, kpi_ids)
+    ]
+    # One BatchWriteItem page instead of a PutItem round trip per proposal.
+    db.batch_put_entities(
+        "kpi",
+        msg.project_id,
+        [(kpi.kpi_id, kpi.model_dump(exclude_none=True, exclude_defaults=True)) for kpi in kpis],
+    )
 
     db.update_item("job", job.job_id, {
         "status": JobStatus.awaiting_kpi_approval.value,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": now_iso(),
     })
 
 
-def _handle_compute_kpis(job: Job, msg: JobMessage) -> None:
+def _required_columns(kpis: list[KPI]) -> set[str]:
+    """Every column any plan touches — the compute stage parses no more."""
+    columns: set[str] = set()
+    for kpi in kpis:
+        plan = kpi.plan
+        for col in (plan.column, plan.numerator_column, plan.denominator_column, plan.time_column):
+            if col:
+                columns.add(col)
+        columns.update(plan.group_by)
+        columns.update(f.column for f in plan.filters)
+    return columns
+
+
+def _handle_compute_kpis(job: Job, msg: JobMessage, ctx: JobContext) -> None:
     """Compute approved KPIs and then enqueue report generation."""
-    kpi_items = db.query_by_project("kpi", msg.project_id)
-    approved_kpis = [KPI(**item) for item in kpi_items if item.get("status") == KPIStatus.approved.value]
+    # The dataset/project rows are needed on the common path where
+    # approvals exist, so prefetch all three reads together.
+    ctx.prefetch("approved_kpis", "datasets", "project")
+    datasets = ctx.datasets
+    project = ctx.project
+    # One pydantic-core batch validation instead of a Python-level KPI()
+    # per item. Full model_construct is not safe here: the engine needs
+    # plan as a KPIPlan (construct would leave the nested dict) and DynamoDB
+    # numbers come back as Decimal, which validation coerces.
+    approved_kpis = KPI_LIST_ADAPTER.validate_python(ctx.approved_kpis)
 
     if not approved_kpis:
         logger.warning("No approved KPIs for project %s", msg.project_id)
         db.update_item("job", job.job_id, {
             "status": JobStatus.complete.value,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": now_iso(),
         })
         return
 
-    datasets = db.query_by_project("dataset", msg.project_id)
     if not datasets:
         raise ValueError("No datasets found for project")
     selected = _select_datasets(datasets, msg.dataset_id)
-    df = _load_combined_dataframe(selected)
+    df = _load_combined_dataframe(selected, columns=_required_columns(approved_kpis) or None)
+    time_columns = {k.plan.time_column for k in approved_kpis if k.plan.time_column}
+    df = _optimize_dtypes(df, skip=time_columns)
 
     logger.info(
         "Computing KPIs project=%s kpis=%s rows=%s cols=%s",
@@ -146,14 +369,18 @@ def _handle_compute_kpis(job: Job, msg: JobMessage) -> None:
             logger.warning("KPI computed null name=%s id=%s", kpi.name, kpi.kpi_id)
         else:
             logger.info("KPI computed value name=%s id=%s value=%s", kpi.name, kpi.kpi_id, kpi.value)
-        db.update_item("kpi", kpi.kpi_id, {
-            "value": kpi.value,
-            "value_breakdown": [b.model_dump() for b in kpi.value_breakdown] if kpi.value_breakdown else None,
-            "computed_at": kpi.computed_at,
-        })
+    # We hold the full KPI objects, so write whole items in BatchWriteItem
+    # pages instead of one UpdateItem round trip per KPI.
+    db.batch_put_entities(
+        "kpi",
+        msg.project_id,
+        [(kpi.kpi_id, kpi.model_dump(exclude_none=True, exclude_defaults=True)) for kpi in computed],
+    )
 
-    profile = prof.profile_dataframe(df)
-    project = db.get_item("project", msg.project_id)
+    # The dashboard prompt wants the full schema, but df is pruned to the
+    # plans' columns — reuse the stored combined profile instead.
+    stored = selected[0].get("profile")
+    profile = DatasetProfile(**stored) if stored else prof.profile_dataframe(df)
     business_description = project.get("business_description", "") if project else ""
     dashboard_spec = llm.generate_dashboard_spec(
         project_id=msg.project_id,
@@ -162,19 +389,15 @@ def _handle_compute_kpis(job: Job, msg: JobMessage) -> None:
         kpis=computed,
     )
     if dashboard_spec:
-        db.put_entity("dashboard", dashboard_spec.dashboard_id, msg.project_id, dashboard_spec.model_dump())
+        db.put_entity("dashboard", dashboard_spec.dashboard_id, msg.project_id, dashboard_spec.model_dump(exclude_none=True, exclude_defaults=True))
         logger.info("Dashboard spec stored project=%s dashboard_id=%s", msg.project_id, dashboard_spec.dashboard_id)
     else:
         logger.warning("Dashboard spec generation failed project=%s", msg.project_id)
 
-    db.update_item("job", job.job_id, {
-        "status": JobStatus.running.value,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-    })
-
-    # Enqueue report generation
+    # Enqueue report generation — process_message already marked this job
+    # running, so the final status write below is the only one needed.
     report_job = Job(project_id=msg.project_id, stage=JobStage.generate_report)
-    db.put_entity("job", report_job.job_id, msg.project_id, report_job.model_dump())
+    db.put_entity("job", report_job.job_id, msg.project_id, report_job.model_dump(exclude_none=True, exclude_defaults=True))
     q.enqueue_job(JobMessage(
         job_id=report_job.job_id,
         project_id=msg.project_id,
@@ -183,14 +406,16 @@ def _handle_compute_kpis(job: Job, msg: JobMessage) -> None:
 
     db.update_item("job", job.job_id, {
         "status": JobStatus.complete.value,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": now_iso(),
     })
 
 
-def _handle_generate_report(job: Job, msg: JobMessage) -> None:
+def _handle_generate_report(job: Job, msg: JobMessage, ctx: JobContext) -> None:
     """Generate advisory report from KPI results."""
-    kpi_items = db.query_by_project("kpi", msg.project_id)
-    computed_kpis = [item for item in kpi_items if item.get("value") is not None]
+    ctx.prefetch("kpis", "datasets", "project")
+    datasets = ctx.datasets
+    project = ctx.project
+    computed_kpis = [item for item in ctx.kpis if item.get("value") is not None]
     kpi_results = [
         {"name": k["name"], "value": k.get("value"), "unit": k.get("unit"), "target": k.get("target")}
         for k in computed_kpis
@@ -202,12 +427,21 @@ def _handle_generate_report(job: Job, msg: JobMessage) -> None:
         len(kpi_results),
     )
 
-    datasets = db.query_by_project("dataset", msg.project_id)
     if not datasets:
         raise ValueError("No datasets found for project")
     selected = _select_datasets(datasets, msg.dataset_id)
-    combined_df = _load_combined_dataframe(selected)
-    profile = prof.profile_dataframe(combined_df)
+
+    # The profile stage already persisted the combined profile on each
+    # dataset item — reuse it instead of re-downloading and re-parsing the
+    # whole upload. Legacy items without one fall back and get backfilled.
+    stored = selected[0].get("profile")
+    if stored:
+        profile = DatasetProfile(**stored)
+    else:
+        combined_df = _load_combined_dataframe(selected)
+        profile = prof.profile_dataframe(combined_df)
+        for dataset in selected:
+            db.update_item("dataset", dataset["dataset_id"], {"profile": profile.model_dump()})
 
     logger.info(
         "Report profile project=%s rows=%s cols=%s",
@@ -216,12 +450,12 @@ def _handle_generate_report(job: Job, msg: JobMessage) -> None:
         profile.column_count,
     )
 
-    project = db.get_item("project", msg.project_id)
     business_description = project.get("business_description", "") if project else ""
+    stored_summary = project.get("business_model_summary", "") if project else ""
 
     bm_summary, risks, compliance, forecasts, recommendations = llm.generate_advisory_report(
         business_description=business_description,
-        business_model_summary="",
+        business_model_summary=stored_summary,
         kpi_results=kpi_results,
         profile=profile,
     )
@@ -235,18 +469,30 @@ def _handle_generate_report(job: Job, msg: JobMessage) -> None:
         recommendations=recommendations,
     )
 
-    # Persist report to S3 as JSON artifact
-    s3_key = f"reports/{msg.project_id}/{report.report_id}.json"
-    storage.upload_file(s3_key, report.model_dump_json().encode(), "application/json")
+    # Persist report to S3 as JSON artifact and to DynamoDB concurrently —
+    # independent round trips, so finalization costs max() not sum(). The
+    # job-status flip stays sequential below: clients poll it as the signal
+    # that the report row exists.
+    # Report JSON compresses ~10x; the artifact is stored gzipped with a
+    # ContentEncoding tag, so download_file and browsers both decompress
+    # transparently.
+    s3_key = f"reports/{msg.project_id}/{report.report_id}.json.gz"
     report = report.model_copy(update={"s3_key": s3_key})
-
-    db.put_entity("report", report.report_id, msg.project_id, report.model_dump())
+    # One pydantic serialization — the S3 artifact and the DynamoDB item
+    # both derive from the same mode="json" dump.
+    payload = report.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+    artifact = gzip.compress(orjson.dumps(payload), compresslevel=6)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        upload = pool.submit(storage.upload_file, s3_key, artifact, "application/json", "gzip")
+        put = pool.submit(db.put_entity, "report", report.report_id, msg.project_id, payload)
+        upload.result()
+        put.result()
 
     logger.info("Report stored project=%s report_id=%s", msg.project_id, report.report_id)
 
     db.update_item("job", job.job_id, {
         "status": JobStatus.complete.value,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": now_iso(),
     })
 
 
@@ -262,6 +508,23 @@ _STAGE_HANDLERS = {
 # Poll loop
 # ---------------------------------------------------------------------------
 
+_VISIBILITY_SECONDS = 900
+
+# Job states that mean the message's work already happened — a redelivery
+# (SQS is at-least-once) must not repeat the S3 reads and LLM spend.
+_FINISHED_STATUSES = frozenset({
+    JobStatus.complete.value,
+    JobStatus.failed.value,
+    JobStatus.awaiting_kpi_approval.value,
+    JobStatus.awaiting_recommendation_approval.value,
+})
+
+# One long-lived pool for message processing — handlers are dominated by
+# S3/DynamoDB/LLM waits, so concurrent jobs interleave I/O rather than
+# contend for CPU, and reusing the pool avoids thread churn per poll.
+_MSG_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="job")
+
+
 def process_message(receipt_handle: str, msg: JobMessage) -> None:
     job_item = db.get_item("job", msg.job_id)
     if not job_item:
@@ -269,34 +532,95 @@ def process_message(receipt_handle: str, msg: JobMessage) -> None:
         q.delete_job(receipt_handle)
         return
 
-    job = Job(**job_item)
+    status = str(job_item.get("status", ""))
+    if status in _FINISHED_STATUSES:
+        logger.info("Skipping redelivered job %s status=%s", msg.job_id, status)
+        q.delete_job(receipt_handle)
+        return
+
+    # LLM-heavy stages can outlive the queue's default visibility timeout;
+    # extend it up front so in-flight messages aren't redelivered.
     try:
-        db.update_item("job", job.job_id, {
-            "status": JobStatus.running.value,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        })
+        q.extend_visibility(receipt_handle, _VISIBILITY_SECONDS)
+    except Exception as exc:
+        logger.warning("Could not extend visibility for job %s: %s", msg.job_id, exc)
+
+    # We wrote the job item ourselves and only read job_id from it —
+    # model_construct skips the validation pass.
+    job = Job.model_construct(**job_item)
+    try:
+        # Conditional transition: the read above races a concurrent worker
+        # finishing the same redelivered message, so guard the write too —
+        # one round trip instead of a second read-then-write pair. Jobs are
+        # stored with exclude_defaults, so a freshly created job has no
+        # status attribute at all — that's the queued state.
+        try:
+            db.update_item(
+                "job",
+                job.job_id,
+                {"status": JobStatus.running.value, "updated_at": now_iso()},
+                condition="attribute_not_exists(#status) OR #status IN (:queued, :status)",
+                condition_values={":queued": JobStatus.queued.value},
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                logger.info("Job %s already finished — skipping redelivery", msg.job_id)
+                return
+            raise
         handler = _STAGE_HANDLERS.get(msg.stage)
         if handler is None:
             raise ValueError(f"Unknown job stage: {msg.stage}")
-        handler(job, msg)
+        handler(job, msg, JobContext(msg.project_id))
     except Exception as exc:
         logger.exception("Job %s failed: %s", job.job_id, exc)
         db.update_item("job", job.job_id, {
             "status": JobStatus.failed.value,
             "error": str(exc),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "updated_at": now_iso(),
         })
     finally:
         q.delete_job(receipt_handle)
 
 
+def _warm_startup() -> None:
+    """Force lazy initialization before the first message arrives.
+
+    Client construction (boto3 service models, the OpenAI HTTP client) and
+    pandas' first C-extension call together cost a noticeable slice of the
+    first message's latency; paying them at startup keeps p99 first-message
+    latency in line with steady state. Best-effort — a failure here (e.g.
+    missing credentials in dev) just moves the cost back to the first job.
+    """
+    for name, warm in (
+        ("dynamodb", db._get_table),
+        ("sqs", q._get_client),
+        ("s3", storage._get_client),
+        ("openai", llm._client),
+        ("pandas", lambda: pd.DataFrame({"a": [1]}).sum()),
+    ):
+        try:
+            warm()
+        except Exception as exc:
+            logger.warning("Startup warm-up skipped %s: %s", name, exc)
+
+
 def run_worker() -> None:
+    _warm_startup()
     logger.info("Worker started — polling SQS")
     while _RUNNING:
         try:
-            messages = q.receive_jobs(max_messages=1, wait_seconds=20)
-            for receipt_handle, msg in messages:
-                process_message(receipt_handle, msg)
+            # Drain up to 10 messages per long poll and overlap them.
+            messages = q.receive_jobs(max_messages=10, wait_seconds=20)
+            if len(messages) <= 1:
+                for receipt_handle, msg in messages:
+                    process_message(receipt_handle, msg)
+            else:
+                futures = [
+                    _MSG_POOL.submit(process_message, receipt_handle, msg)
+                    for receipt_handle, msg in messages
+                ]
+                for future in as_completed(futures):
+                    future.result()
         except Exception as exc:
             logger.exception("Error in poll loop: %s", exc)
             time.sleep(5)
@@ -0,0 +1,143 @@
+"""Tests for the DynamoDB service — batch helpers and conditional updates."""
+from __future__ import annotations
+
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from app.services import database as db
+
+
+def _create_table(resource) -> None:
+    """Create the single table with the GSIs the service queries."""
+    resource.create_table(
+        TableName="argus",
+        BillingMode="PAY_PER_REQUEST",
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+            {"AttributeName": "project_id", "AttributeType": "S"},
+            {"AttributeName": "entity_type", "AttributeType": "S"},
+            {"AttributeName": "entity_created", "AttributeType": "S"},
+            {"AttributeName": "status_gsi_pk", "AttributeType": "S"},
+        ],
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "project_id-entity-index",
+                "KeySchema": [
+                    {"AttributeName": "project_id", "KeyType": "HASH"},
+                    {"AttributeName": "entity_type", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "entity-index",
+                "KeySchema": [{"AttributeName": "entity_type", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "project_id-created-index",
+                "KeySchema": [
+                    {"AttributeName": "project_id", "KeyType": "HASH"},
+                    {"AttributeName": "entity_created", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "kpi-status-index",
+                "KeySchema": [{"AttributeName": "status_gsi_pk", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ],
+    )
+
+
+@pytest.fixture()
+def dynamodb(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    from app.config import get_settings
+
+    get_settings.cache_clear()
+    db._get_session.cache_clear()
+    db._get_table.cache_clear()
+    with mock_aws():
+        _create_table(db._get_session().resource("dynamodb"))
+        yield
+    get_settings.cache_clear()
+    db._get_session.cache_clear()
+    db._get_table.cache_clear()
+
+
+class TestBatchHelpers:
+    def test_batch_put_entities_roundtrip(self, dynamodb):
+        rows = [
+            (f"kpi-{i}", {"name": f"KPI {i}", "status": "approved", "created_at": f"2024-01-0{i + 1}"})
+            for i in range(3)
+        ]
+        db.batch_put_entities("kpi", "proj-1", rows)
+
+        items = db.query_by_project("kpi", "proj-1")
+        assert {item["PK"] for item in items} == {f"KPI#kpi-{i}" for i in range(3)}
+        # The sparse status GSI key is maintained like put_entity would.
+        approved = db.query_kpis_by_status("proj-1", "approved")
+        assert len(approved) == 3
+
+    def test_batch_get_pages_past_100_keys(self, dynamodb):
+        ids = [f"kpi-{i}" for i in range(120)]
+        db.batch_put_entities("kpi", "proj-1", [(kpi_id, {"name": kpi_id}) for kpi_id in ids])
+
+        results = db.batch_get("kpi", ids)
+        assert len(results) == 120
+        assert results["kpi-0"]["name"] == "kpi-0"
+        assert results["kpi-119"]["name"] == "kpi-119"
+
+    def test_batch_get_missing_ids_absent(self, dynamodb):
+        db.batch_put_entities("kpi", "proj-1", [("kpi-1", {"name": "KPI 1"})])
+        results = db.batch_get("kpi", ["kpi-1", "kpi-2"])
+        assert set(results) == {"kpi-1"}
+
+    def test_query_latest_returns_newest(self, dynamodb):
+        db.put_entity("report", "r-1", "proj-1", {"created_at": "2024-01-01"})
+        db.put_entity("report", "r-2", "proj-1", {"created_at": "2024-02-01"})
+        latest = db.query_latest("report", "proj-1")
+        assert latest is not None
+        assert latest["PK"] == "REPORT#r-2"
+
+
+class TestConditionalUpdate:
+    def test_update_without_condition(self, dynamodb):
+        db.put_entity("job", "job-1", "proj-1", {"stage": "profile"})
+        db.update_item("job", "job-1", {"status": "running"})
+        assert db.get_item("job", "job-1")["status"] == "running"
+
+    def test_condition_accepts_missing_status(self, dynamodb):
+        # Jobs are written with exclude_defaults, so a fresh job item has no
+        # status attribute — the worker's running transition must accept it.
+        db.put_entity("job", "job-1", "proj-1", {"stage": "profile"})
+        db.update_item(
+            "job",
+            "job-1",
+            {"status": "running"},
+            condition="attribute_not_exists(#status) OR #status IN (:queued, :status)",
+            condition_values={":queued": "queued"},
+        )
+        assert db.get_item("job", "job-1")["status"] == "running"
+
+    def test_condition_rejects_finished_job(self, dynamodb):
+        db.put_entity("job", "job-1", "proj-1", {"stage": "profile", "status": "complete"})
+        with pytest.raises(ClientError) as exc_info:
+            db.update_item(
+                "job",
+                "job-1",
+                {"status": "running"},
+                condition="attribute_not_exists(#status) OR #status IN (:queued, :status)",
+                condition_values={":queued": "queued"},
+            )
+        assert exc_info.value.response["Error"]["Code"] == "ConditionalCheckFailedException"
+        assert db.get_item("job", "job-1")["status"] == "complete"
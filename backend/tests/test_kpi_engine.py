@@ -132,6 +132,43 @@ class TestExecutePlan:
         plan = KPIPlan(metric="median", column="revenue")  # type: ignore[arg-type]
         assert execute_plan(df, plan) is None
 
+    def test_missing_filter_column_returns_none(self):
+        df = _sales_df()
+        plan = KPIPlan(
+            metric="sum",
+            column="revenue",
+            filters=[KPIFilter(column="nonexistent", operator="eq", value="A")],
+        )
+        assert execute_plan(df, plan) is None
+
+    def test_missing_filter_column_skips_breakdown(self):
+        df = _sales_df()
+        plan = KPIPlan(
+            metric="sum",
+            column="revenue",
+            group_by=["category"],
+            filters=[KPIFilter(column="nonexistent", operator="eq", value="A")],
+        )
+        assert build_breakdown(df, plan) is None
+
+    def test_time_window_anchor_ignores_filters(self):
+        # Category A's latest row (Jan 8) lags the frame's latest (Jan 10).
+        # The window cutoff must anchor on the whole frame's max — Jan 7 —
+        # so only the Jan 8 row counts, not A's own trailing 3 days.
+        df = pd.DataFrame({
+            "revenue": [10, 50, 100, 999],
+            "category": ["A", "A", "A", "B"],
+            "date": pd.to_datetime(["2024-01-02", "2024-01-06", "2024-01-08", "2024-01-10"]),
+        })
+        plan = KPIPlan(
+            metric="sum",
+            column="revenue",
+            time_column="date",
+            time_window_days=3,
+            filters=[KPIFilter(column="category", operator="eq", value="A")],
+        )
+        assert execute_plan(df, plan) == pytest.approx(100.0)
+
 
 class TestComputeKPIs:
     def test_compute_kpis_updates_value(self):
@@ -190,3 +227,46 @@ class TestComputeKPIs:
         assert len(results) == 2
         assert results[0].value == pytest.approx(2225.0)
         assert results[1].value == 10.0
+
+    def test_grouped_value_label_breakdown_consistent(self):
+        df = _sales_df()
+        kpi = KPI(
+            project_id="proj-1",
+            name="Revenue Mix",
+            description="Revenue by category",
+            rationale="Mix",
+            formula="SUM(revenue) by category",
+            plan=KPIPlan(metric="sum", column="revenue", group_by=["category"]),
+            status=KPIStatus.approved,
+        )
+        result = compute_kpis(df, [kpi])[0]
+        # Category A: 875, category B: 1350 — value is the grouped total,
+        # the label names the top group, and the breakdown sums back to it.
+        assert result.value == pytest.approx(2225.0)
+        assert result.value_label == "B"
+        assert result.value_breakdown is not None
+        assert sum(b.value for b in result.value_breakdown) == pytest.approx(2225.0)
+        assert result.value_breakdown[0].label == "B"
+
+    def test_grouped_missing_filter_column_returns_none(self):
+        df = _sales_df()
+        kpi = KPI(
+            project_id="proj-1",
+            name="Revenue Mix",
+            description="Revenue by category",
+            rationale="Mix",
+            formula="SUM(revenue) by category",
+            plan=KPIPlan(
+                metric="sum",
+                column="revenue",
+                group_by=["category"],
+                filters=[KPIFilter(column="nonexistent", operator="eq", value="A")],
+            ),
+            status=KPIStatus.approved,
+        )
+        result = compute_kpis(df, [kpi])[0]
+        # The predicate can't be honoured, so the grouped path must bail
+        # out like the ungrouped one — not report the unfiltered total.
+        assert result.value is None
+        assert result.value_label is None
+        assert result.value_breakdown is None
@@ -0,0 +1,75 @@
+"""Tests for the S3 service — gzip round-trips for uploads and artifacts."""
+from __future__ import annotations
+
+import gzip
+import io
+
+import pytest
+from moto import mock_aws
+
+from app.services import storage
+
+
+@pytest.fixture()
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    from app.config import get_settings
+
+    get_settings.cache_clear()
+    storage._get_client.cache_clear()
+    with mock_aws():
+        storage._get_client().create_bucket(Bucket="argus-uploads")
+        yield
+    get_settings.cache_clear()
+    storage._get_client.cache_clear()
+
+
+_CSV = b"order_id,revenue\n1,100\n2,200\n"
+
+
+class TestUploadFileobj:
+    def test_csv_upload_is_gzipped(self, s3):
+        key = storage.upload_fileobj("uploads/p1/d1/data.csv", io.BytesIO(_CSV), "text/csv")
+        assert key == "uploads/p1/d1/data.csv.gz"
+
+        head = storage._get_client().head_object(Bucket="argus-uploads", Key=key)
+        assert head["ContentEncoding"] == "gzip"
+        # The stored body is actually compressed, not just tagged.
+        raw = storage._get_client().get_object(Bucket="argus-uploads", Key=key)["Body"].read()
+        assert gzip.decompress(raw) == _CSV
+
+    def test_download_file_round_trips(self, s3):
+        key = storage.upload_fileobj("uploads/p1/d1/data.csv", io.BytesIO(_CSV), "text/csv")
+        assert storage.download_file(key) == _CSV
+
+    def test_open_stream_decompresses(self, s3):
+        key = storage.upload_fileobj("uploads/p1/d1/data.csv", io.BytesIO(_CSV), "text/csv")
+        with storage.open_stream(key) as stream:
+            assert stream.read() == _CSV
+
+    def test_binary_upload_not_compressed(self, s3):
+        body = b"\x00\x01binary"
+        key = storage.upload_fileobj(
+            "cache/frames/abc.parquet", io.BytesIO(body), "application/octet-stream"
+        )
+        assert key == "cache/frames/abc.parquet"
+        assert storage.download_file(key) == body
+
+
+class TestUploadFile:
+    def test_plain_put_round_trips(self, s3):
+        storage.upload_file("reports/p1/r1.json", b'{"a": 1}', "application/json")
+        assert storage.download_file("reports/p1/r1.json") == b'{"a": 1}'
+
+    def test_gzipped_artifact_round_trips(self, s3):
+        # The worker stores report artifacts pre-compressed with the
+        # ContentEncoding tag — download_file must hand back the raw JSON.
+        payload = b'{"report": "x"}'
+        storage.upload_file(
+            "reports/p1/r1.json.gz", gzip.compress(payload), "application/json", "gzip"
+        )
+        head = storage._get_client().head_object(Bucket="argus-uploads", Key="reports/p1/r1.json.gz")
+        assert head["ContentEncoding"] == "gzip"
+        assert storage.download_file("reports/p1/r1.json.gz") == payload